@@ -46,6 +46,7 @@ from chess_com_api.models import (
     PlayerTournaments,
     Round,
     Streamer,
+    TimeControlStats,
     Tournament,
     UserClub,
 )
@@ -73,6 +74,7 @@ __all__ = [
     "PlayerTournaments",
     "Round",
     "Streamer",
+    "TimeControlStats",
     "Tournament",
     "UserClub",
 ]
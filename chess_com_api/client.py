@@ -4,11 +4,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import math
+import random
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
 
-from .exceptions import ChessComAPIError, GoneError, NotFoundError, RedirectError
+from .exceptions import (
+    ChessComAPIError,
+    GoneError,
+    NotFoundError,
+    RateLimitError,
+    RedirectError,
+    ValidationError,
+)
 from .models import (
     Board,
     BoardGame,
@@ -33,14 +60,115 @@ from .models import (
     UserClub,
 )
 
+try:  # Prefer orjson's C parser for large archive responses when available.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:  # msgspec's decoder is a comparable C-level alternative.
+        import msgspec.json
+
+        _json_loads = msgspec.json.decode
+    except ImportError:
+        import json
+
+        _json_loads = json.loads
+
+try:  # Optional HTTP/2 transport; install the "http2" extra to enable it.
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:  # Optional async file I/O keeps PGN downloads from blocking the loop.
+    import aiofiles
+except ImportError:
+    aiofiles = None  # type: ignore[assignment]
+
+# Transport-level errors that warrant a retry, per installed backend.
+_TRANSPORT_ERRORS: Tuple[type, ...] = (aiohttp.ClientError,)
+if httpx is not None:
+    _TRANSPORT_ERRORS += (httpx.HTTPError,)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared, immutable default headers; reusing one case-insensitive multidict
+# saves aiohttp from re-hashing the header keys on every request.
+_DEFAULT_HEADERS: CIMultiDictProxy[str] = CIMultiDictProxy(
+    CIMultiDict(
+        {
+            "Accept": "application/json",
+            "User-Agent": "ChessComAPI-Python/2.0",
+        }
+    )
+)
+
+
+class _Retry(Exception):
+    """Internal signal that a request attempt should be retried.
+
+    :ivar delay: Seconds to sleep before the next attempt.
+    :type delay: float
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        super().__init__(delay)
+
+
+def _require_nonempty(**values: str) -> None:
+    """Raise ValidationError if any given string argument is empty or blank.
+
+    Validating before a request is scheduled avoids burning a rate-limit slot
+    and a full round trip on input that can only produce a 404.
+
+    :param values: Argument names mapped to the values to check.
+    :type values: str
+    :raises ValidationError: If any value is empty or only whitespace.
+    """
+    for name, value in values.items():
+        if not value or not value.strip():
+            raise ValidationError(f"{name} cannot be empty")
+
 
 class ChessComClient:
     """Asynchronous client for the Chess.com API."""
 
     BASE_URL = "https://api.chess.com/pub"
+    RETRY_BACKOFF_BASE = 0.05
+    RETRY_BACKOFF_JITTER = 0.1
+    CACHE_MAX_SIZE = 256
+    ARCHIVE_CACHE_TTL = 60.0
+    PLAYER_BATCH_WINDOW = 0.005
+    ENTITY_CACHE_TTL = 300.0
+    READ_BUFSIZE = 4 * 1024 * 1024
+
+    # Endpoint templates, formatted positionally so the per-call cost is a
+    # single str.format rather than rebuilding each path piece by piece.
+    _EP_PLAYER = "/player/{}"
+    _EP_TITLED = "/titled/{}"
+    _EP_PLAYER_STATS = "/player/{}/stats"
+    _EP_PLAYER_GAMES = "/player/{}/games"
+    _EP_PLAYER_GAMES_TO_MOVE = "/player/{}/games/to-move"
+    _EP_PLAYER_GAME_ARCHIVES = "/player/{}/games/archives"
+    _EP_PLAYER_ARCHIVE = "/player/{}/games/{}/{}"
+    _EP_PLAYER_ARCHIVE_PGN = "/player/{}/games/{}/{}/pgn"
+    _EP_PLAYER_CLUBS = "/player/{}/clubs"
+    _EP_PLAYER_MATCHES = "/player/{}/matches"
+    _EP_PLAYER_TOURNAMENTS = "/player/{}/tournaments"
+    _EP_CLUB = "/club/{}"
+    _EP_CLUB_MEMBERS = "/club/{}/members"
+    _EP_CLUB_MATCHES = "/club/{}/matches"
+    _EP_TOURNAMENT = "/tournament/{}"
+    _EP_TOURNAMENT_ROUND = "/tournament/{}/{}"
+    _EP_TOURNAMENT_ROUND_GROUP = "/tournament/{}/{}/{}"
+    _EP_MATCH = "/match/{}"
+    _EP_MATCH_BOARD = "/match/{}/{}"
+    _EP_LIVE_MATCH = "/match/live/{}"
+    _EP_LIVE_MATCH_BOARD = "/match/live/{}/{}"
+    _EP_COUNTRY = "/country/{}"
+    _EP_COUNTRY_PLAYERS = "/country/{}/players"
+    _EP_COUNTRY_CLUBS = "/country/{}/clubs"
 
     def __init__(
         self,
@@ -48,26 +176,141 @@ class ChessComClient:
         timeout: int = 30,
         max_retries: int = 3,
         rate_limit: int = 300,
+        transport: Literal["aiohttp", "httpx"] = "aiohttp",
+        limit_per_host: Optional[int] = None,
     ) -> None:
-        """Initialize the Chess.com API client."""
+        """Initialize the Chess.com API client.
+
+        When no session is supplied the client creates and owns one, closing
+        it in :meth:`close`. A user-supplied session is only borrowed: the
+        caller keeps responsibility for closing it, so one session can safely
+        be shared across several clients and other libraries.
+
+        ``limit_per_host`` caps the owned connector's warm keep-alive
+        connections to the API host; it defaults to ``rate_limit`` so the
+        connection pool never throttles below the request limiter.
+
+        The optional ``"httpx"`` transport multiplexes all requests over a
+        single HTTP/2 connection instead of one socket per in-flight request;
+        it requires the ``http2`` extra (``pip install chess-com-api[http2]``).
+        """
+        if transport not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unknown transport: {transport!r}")
+        if transport == "httpx" and httpx is None:
+            raise ImportError(
+                "The httpx transport requires the 'http2' extra: "
+                "pip install chess-com-api[http2]"
+            )
+        self._transport = transport
+        self._timeout_seconds = timeout
+        self._httpx_client: Optional[httpx.AsyncClient] = None
         self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self.session = session or aiohttp.ClientSession(timeout=self.timeout)
+        self._owns_session = session is None
+        self._session = session
+        self._rate_limit = rate_limit
+        self._limit_per_host = limit_per_host or rate_limit
+        if (
+            session is not None
+            and isinstance(session.connector, aiohttp.TCPConnector)
+            and 0 < session.connector.limit_per_host < rate_limit
+        ):
+            logger.warning(
+                "Session connector allows %d connections per host, below the "
+                "configured rate limit of %d; requests will queue on the "
+                "connection pool.",
+                session.connector.limit_per_host,
+                rate_limit,
+            )
         self.max_retries = max_retries
-        self._rate_limit = asyncio.Semaphore(rate_limit)
-        self._headers: Dict[str, str] = {
-            "Accept": "application/json",
-            "User-Agent": "ChessComAPI-Python/2.0",
-        }
+        self._rate_limit_cond = asyncio.Condition()
+        self._in_flight = 0
+        self._max_in_flight = rate_limit
+        self._cache: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._etag_cache: OrderedDict[URL, Tuple[str, Any]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future[Any]] = {}
+        self._headers = _DEFAULT_HEADERS
+        self._base = URL(self.BASE_URL)
+        self._pending_players: Dict[str, asyncio.Future[Player]] = {}
+        self._player_flush_task: Optional[asyncio.Task[None]] = None
+        self._entity_cache: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._entity_refreshes: Dict[str, asyncio.Task[None]] = {}
+        self._entity_inflight: Dict[str, asyncio.Future[Any]] = {}
+        self._country_cache: Dict[str, Country] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating the owned one on first use.
+
+        Deferring creation until a request is actually made keeps the session
+        bound to the event loop that runs it, instead of whichever loop (if
+        any) happened to be active when the client was constructed. Creation
+        is synchronous, so concurrent first requests on one loop cannot race.
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Build the client-owned session with its tuned connector."""
+        connector = aiohttp.TCPConnector(
+            limit=self._rate_limit,
+            limit_per_host=self._limit_per_host,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            timeout=self.timeout,
+            connector=connector,
+            read_bufsize=self.READ_BUFSIZE,
+            max_line_size=16384,
+            max_field_size=16384,
+        )
+
+    def _get_httpx_client(self) -> httpx.AsyncClient:
+        """Return the HTTP/2 client, creating it on first use."""
+        if self._httpx_client is None:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                timeout=self._timeout_seconds,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=self._rate_limit,
+                ),
+                headers=dict(self._headers),
+                # aiohttp follows redirects by default; keep both transports
+                # consistent so the same call cannot fail on one of them.
+                follow_redirects=True,
+            )
+        return self._httpx_client
 
     async def close(self) -> None:
-        """Close the client session."""
-        await self.session.close()
+        """Close the client session if this client owns it.
+
+        Borrowed sessions (passed in by the caller) are left open so that
+        other users of the same session keep their connection pool. The
+        HTTP/2 client is always created by this client, so it is always
+        closed here.
+        """
+        if self._player_flush_task is not None and not self._player_flush_task.done():
+            await self._player_flush_task
+        for refresh in list(self._entity_refreshes.values()):
+            if not refresh.done():
+                await refresh
+        if self._owns_session and self._session is not None:
+            if not self._session.closed:
+                await self._session.close()
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            await self._httpx_client.aclose()
 
     async def _make_request(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         bytestream: bool = False,
+        cache_ttl: Optional[float] = None,
+        use_etag: bool = True,
     ) -> dict[str, Any] | bytes | None:
         """Make an API request to the specified endpoint with retry logic.
 
@@ -78,96 +321,429 @@ class ChessComClient:
         :param bytestream: Flag to determine if the response should be treated as binary
             data. Default is False.
         :type bytestream: bool
+        :param cache_ttl: How long to keep the response in the in-memory cache,
+            in seconds. Use ``math.inf`` for immutable resources such as past
+            monthly archives. Default is None (no caching).
+        :type cache_ttl: Optional[float]
+        :param use_etag: Send ``If-None-Match`` with the last seen ETag for
+            this URL and serve the cached body on a 304 response. Only applies
+            to JSON requests. Default is True.
+        :type use_etag: bool
         :return: The API response, either as a dictionary (if JSON)
             or as bytes (if bytestream).
         :rtype: Union[Dict[str, Any], bytes]
         """
-        url = f"{self.BASE_URL}{endpoint}"
-        retry_intervals = [0.05, 0.1, 0.2, 0.5, 1.0, 2.0]
+        url = self._base / endpoint.lstrip("/")
+        cache_key = self._cache_key(url, params) if cache_ttl else None
+
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        if bytestream:
+            return await self._request_with_retries(
+                url, params, bytestream, use_etag, cache_key, cache_ttl
+            )
+
+        # Single-flight: concurrent callers hitting the same URL share one
+        # HTTP request instead of each paying a full round trip.
+        key = self._cache_key(url, params)
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await existing  # type: ignore[no-any-return]
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._request_with_retries(
+                url, params, bytestream, use_etag, cache_key, cache_ttl
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Consumed here; waiters re-raise their copy.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
 
-        async with self._rate_limit:
+    async def _request_with_retries(
+        self,
+        url: URL,
+        params: Optional[Dict[str, Any]],
+        bytestream: bool,
+        use_etag: bool,
+        cache_key: Optional[str],
+        cache_ttl: Optional[float],
+    ) -> dict[str, Any] | bytes | None:
+        """Run a request through admission control, retries, and the cache."""
+        await self._acquire_slot()
+        try:
             for attempt in range(self.max_retries):
                 try:
-                    return await self._attempt_request(url, params, bytestream)
-                except (asyncio.TimeoutError, ChessComAPIError) as e:
-                    await self._handle_retry_error(e, attempt, retry_intervals)
-                except Exception as e:
-                    await self._handle_unexpected_error(e, attempt, retry_intervals)
+                    result = await self._once(
+                        url, params, bytestream, use_etag, attempt
+                    )
+                except _Retry as retry:
+                    await asyncio.sleep(retry.delay)
+                    continue
+                if cache_key is not None and cache_ttl is not None:
+                    self._cache_set(cache_key, result, cache_ttl)
+                return result
             return None
+        finally:
+            await self._release_slot()
+
+    async def _once(
+        self,
+        url: URL,
+        params: Optional[Dict[str, Any]],
+        bytestream: bool,
+        use_etag: bool,
+        attempt: int,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Perform one request attempt, raising _Retry for retryable failures.
+
+        Terminal errors (resource gone, not found, retries exhausted, or
+        anything that is not a transport/API error) propagate as-is;
+        cancellation is never swallowed.
+        """
+        try:
+            return await self._attempt_request(url, params, bytestream, use_etag)
+        except asyncio.CancelledError:
+            raise
+        except (
+            *_TRANSPORT_ERRORS,
+            asyncio.TimeoutError,
+            ChessComAPIError,
+        ) as e:
+            raise _Retry(self._retry_delay(e, attempt)) from e
+
+    @classmethod
+    def _archive_cache_ttl(cls, year: int, month: Union[str, int]) -> float:
+        """Return the cache TTL for a monthly archive.
+
+        Archives for months that have already ended are immutable and can be
+        cached forever; the current (or a future) month keeps a short TTL so
+        newly finished games show up.
+        """
+        now = datetime.now()
+        if (int(year), int(month)) < (now.year, now.month):
+            return math.inf
+        return cls.ARCHIVE_CACHE_TTL
+
+    async def _get_entity(
+        self, key: str, fetch: "Callable[[], Awaitable[Any]]"
+    ) -> Any:
+        """Return a cached entity with stale-while-revalidate semantics.
+
+        Fresh entries are returned directly. Expired entries are served
+        immediately as well, with one background task scheduled to refresh
+        them, so repeat lookups never wait on the network once primed. Only
+        a cache miss pays the full round trip.
+
+        :param key: The cache key identifying the entity.
+        :type key: str
+        :param fetch: Coroutine factory performing the real lookup.
+        :type fetch: Callable[[], Awaitable[Any]]
+        :return: The cached or freshly fetched entity.
+        :rtype: Any
+        """
+        entry = self._entity_cache.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            self._entity_cache.move_to_end(key)
+            if expires_at <= time.monotonic() and key not in self._entity_refreshes:
+                task = asyncio.get_running_loop().create_task(
+                    self._refresh_entity(key, fetch)
+                )
+                self._entity_refreshes[key] = task
+            return value
+        value = await self._singleflight(key, fetch)
+        self._entity_cache_set(key, value)
+        return value
+
+    async def _singleflight(
+        self, key: str, fetch: "Callable[[], Awaitable[Any]]"
+    ) -> Any:
+        """Deduplicate concurrent lookups for the same parsed entity.
+
+        The HTTP layer already shares raw responses between concurrent
+        callers, but each caller would still parse its own copy of the body.
+        Here the first caller for ``key`` does the fetch and parse once while
+        the rest await its future and share the resulting object.
+
+        :param key: The key identifying the entity being fetched.
+        :type key: str
+        :param fetch: Coroutine factory performing the real lookup.
+        :type fetch: Callable[[], Awaitable[Any]]
+        :return: The fetched entity.
+        :rtype: Any
+        """
+        existing = self._entity_inflight.get(key)
+        if existing is not None:
+            return await existing
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._entity_inflight[key] = future
+        try:
+            result = await fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Consumed here; waiters re-raise their copy.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._entity_inflight[key]
+
+    async def _refresh_entity(
+        self, key: str, fetch: "Callable[[], Awaitable[Any]]"
+    ) -> None:
+        """Refresh a stale entity in the background, keeping it on failure."""
+        try:
+            self._entity_cache_set(key, await fetch())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Background refresh of %s failed: %s", key, e)
+        finally:
+            del self._entity_refreshes[key]
+
+    def _entity_cache_set(self, key: str, value: Any) -> None:
+        """Store an entity for ENTITY_CACHE_TTL seconds, evicting the oldest."""
+        self._entity_cache[key] = (time.monotonic() + self.ENTITY_CACHE_TTL, value)
+        self._entity_cache.move_to_end(key)
+        while len(self._entity_cache) > self.CACHE_MAX_SIZE:
+            self._entity_cache.popitem(last=False)
+
+    @staticmethod
+    def _cache_key(url: URL, params: Optional[Dict[str, Any]]) -> str:
+        """Build the cache key for a request URL and its query parameters."""
+        if not params:
+            return str(url)
+        return (
+            str(url) + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        )
+
+    def _cache_get(self, key: str) -> Union[Dict[str, Any], bytes, None]:
+        """Return the cached response for ``key`` if it has not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
+
+    def _cache_set(
+        self, key: str, value: Union[Dict[str, Any], bytes, None], ttl: float
+    ) -> None:
+        """Cache a response for ``ttl`` seconds, evicting the oldest entries."""
+        self._cache[key] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
+    def _etag_get(self, url: URL) -> Optional[Tuple[str, Any]]:
+        """Return the stored (ETag, body) pair for ``url``, refreshing recency."""
+        entry = self._etag_cache.get(url)
+        if entry is not None:
+            self._etag_cache.move_to_end(url)
+        return entry
+
+    def _etag_set(self, url: URL, etag: str, body: Any) -> None:
+        """Store a validated body under its ETag, evicting the oldest entries."""
+        self._etag_cache[url] = (etag, body)
+        self._etag_cache.move_to_end(url)
+        while len(self._etag_cache) > self.CACHE_MAX_SIZE:
+            self._etag_cache.popitem(last=False)
+
+    async def _acquire_slot(self) -> None:
+        """Wait until a request slot is available and claim it."""
+        async with self._rate_limit_cond:
+            await self._rate_limit_cond.wait_for(
+                lambda: self._in_flight < self._max_in_flight
+            )
+            self._in_flight += 1
+
+    async def _release_slot(self) -> None:
+        """Release a previously claimed request slot and wake one waiter."""
+        async with self._rate_limit_cond:
+            self._in_flight -= 1
+            self._rate_limit_cond.notify(1)
+
+    async def set_rate_limit(self, rate_limit: int) -> None:
+        """Change the maximum number of concurrent requests at runtime.
+
+        Raising the limit wakes all waiters so they can re-check the new
+        capacity; lowering it lets in-flight requests drain naturally without
+        admitting new ones beyond the new ceiling.
+
+        :param rate_limit: The new maximum number of concurrent requests.
+        :type rate_limit: int
+        """
+        if rate_limit < 1:
+            raise ValueError("Rate limit must be at least 1")
+        async with self._rate_limit_cond:
+            self._max_in_flight = rate_limit
+            self._rate_limit_cond.notify_all()
 
     async def _attempt_request(
-        self, url: str, params: Optional[Dict[str, Any]], bytestream: bool
+        self,
+        url: URL,
+        params: Optional[Dict[str, Any]],
+        bytestream: bool,
+        use_etag: bool = False,
     ) -> Union[Dict[str, Any], bytes]:
         """Attempt a single API request."""
+        if self._transport == "httpx":
+            return await self._attempt_request_httpx(url, params, bytestream, use_etag)
+        headers: Union[CIMultiDictProxy[str], CIMultiDict[str]] = self._headers
+        cached = self._etag_get(url) if use_etag and not bytestream else None
+        if cached is not None:
+            headers = CIMultiDict(self._headers)
+            headers["If-None-Match"] = cached[0]
         async with self.session.get(
-            url, params=params, headers=self._headers, timeout=self.timeout
+            url, params=params, headers=headers, timeout=self.timeout
         ) as response:
             if response.status == 200:
-                return await self._handle_successful_response(response, bytestream)
-            else:
-                await self._handle_http_error(response)
-                raise ChessComAPIError(
-                    f"Request failed with status code {response.status}"
+                result = await self._handle_successful_response(response, bytestream)
+                if use_etag and not bytestream:
+                    new_etag = response.headers.get("ETag")
+                    if new_etag:
+                        self._etag_set(url, new_etag, result)
+                return result
+            if cached is not None and response.status == 304:
+                return cached[1]  # type: ignore[no-any-return]
+            await self._handle_http_error(response)
+            raise ChessComAPIError(
+                f"Request failed with status code {response.status}"
+            )
+
+    async def _attempt_request_httpx(
+        self,
+        url: URL,
+        params: Optional[Dict[str, Any]],
+        bytestream: bool,
+        use_etag: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Attempt a single API request over the HTTP/2 transport."""
+        client = self._get_httpx_client()
+        headers: Optional[Dict[str, str]] = None
+        cached = self._etag_get(url) if use_etag and not bytestream else None
+        if cached is not None:
+            headers = {"If-None-Match": cached[0]}
+        response = await client.get(str(url), params=params, headers=headers)
+        if response.status_code == 200:
+            result: Union[Dict[str, Any], bytes] = (
+                response.content if bytestream else _json_loads(response.content)
+            )
+            if use_etag and not bytestream:
+                new_etag = response.headers.get("ETag")
+                if new_etag:
+                    self._etag_set(url, new_etag, result)
+            return result
+        if cached is not None and response.status_code == 304:
+            return cached[1]  # type: ignore[no-any-return]
+        not_found_message = "Unknown error"
+        if response.status_code == 404:
+            try:
+                not_found_message = _json_loads(response.content).get(
+                    "message", not_found_message
                 )
+            except ValueError:
+                pass
+        self._raise_for_status(
+            response.status_code, response.headers, str(url), not_found_message
+        )
+        raise ChessComAPIError(
+            f"Request failed with status code {response.status_code}"
+        )
 
     @staticmethod
     async def _handle_successful_response(
         response: aiohttp.ClientResponse, bytestream: bool
     ) -> Union[Dict[str, Any], bytes]:
-        """Handle a successful HTTP response."""
-        return (
-            await response.json() if not bytestream else await response.content.read()
-        )
+        """Handle a successful HTTP response.
 
-    @staticmethod
-    async def _handle_http_error(response: aiohttp.ClientResponse) -> None:
+        JSON bodies are decoded straight from the raw bytes in one shot;
+        ``orjson`` (and the stdlib parser) accept bytes directly, so this
+        skips the intermediate text decode and content-type inspection that
+        ``response.json()`` performs per call.
+        """
+        body = await response.read()
+        return _json_loads(body) if not bytestream else body
+
+    @classmethod
+    async def _handle_http_error(cls, response: aiohttp.ClientResponse) -> None:
         """Handle various HTTP error responses."""
-        if response.status == 429:
-            raise ChessComAPIError("Rate limit hit")
+        not_found_message = "Unknown error"
         if response.status == 404:
-            data = await response.json()
-            raise NotFoundError(
-                f"Resource not found: {data.get('message', 'Unknown error')}"
-            )
-        if response.status in (301, 304):
-            raise RedirectError(f"Resource moved or not modified: {response.url}")
-        if response.status == 410:
-            raise GoneError(f"Resource is no longer available: {response.url}")
-        if 500 <= response.status < 600:
-            raise ChessComAPIError(f"Server error {response.status}")
-
-    async def _handle_retry_error(
-        self,
-        error: Union[asyncio.TimeoutError, ChessComAPIError],
-        attempt: int,
-        retry_intervals: List[float],
-    ) -> None:
-        """Handle errors that should trigger a retry."""
-        backoff_time = retry_intervals[min(attempt, len(retry_intervals) - 1)]
-        if isinstance(error, asyncio.TimeoutError):
-            print(f"Timeout. Retrying in {backoff_time:.2f} seconds...")
-        else:
-            print(f"{error}. Retrying in {backoff_time:.2f} seconds...")
-        if attempt == self.max_retries - 1:
-            raise ChessComAPIError("Max retries reached") from error
-        if isinstance(error, (GoneError, NotFoundError)):
-            raise error from error
-        await asyncio.sleep(backoff_time)
+            try:
+                not_found_message = _json_loads(await response.read()).get(
+                    "message", not_found_message
+                )
+            except ValueError:
+                pass
+        cls._raise_for_status(
+            response.status, response.headers, str(response.url), not_found_message
+        )
 
-    async def _handle_unexpected_error(
-        self, error: Exception, attempt: int, retry_intervals: List[float]
+    @staticmethod
+    def _raise_for_status(
+        status: int,
+        headers: Any,
+        url: str,
+        not_found_message: str = "Unknown error",
     ) -> None:
-        """Handle unexpected errors."""
-        backoff_time = retry_intervals[min(attempt, len(retry_intervals) - 1)]
-        print(f"Unexpected error: {error}. Retrying in {backoff_time:.2f} seconds...")
+        """Map an HTTP error status to the matching exception, if any."""
+        if status == 429:
+            retry_after = headers.get("Retry-After")
+            raise RateLimitError(
+                "Rate limit hit",
+                retry_after=float(retry_after) if retry_after else None,
+            )
+        if status == 404:
+            raise NotFoundError(f"Resource not found: {not_found_message}")
+        if status in (301, 304):
+            raise RedirectError(f"Resource moved or not modified: {url}")
+        if status == 410:
+            raise GoneError(f"Resource is no longer available: {url}")
+        if 500 <= status < 600:
+            raise ChessComAPIError(f"Server error {status}")
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Return how long to sleep before retrying, or raise terminal errors.
+
+        The delay honors the server's ``Retry-After`` header when one was
+        provided, and otherwise grows exponentially with the attempt number. A
+        small random jitter is added in both cases so that many concurrent
+        tasks hitting the same limit do not retry in lockstep.
+
+        :param error: The error that triggered the retry.
+        :type error: Exception
+        :param attempt: The zero-based index of the attempt that just failed.
+        :type attempt: int
+        :return: Seconds to sleep before the next attempt.
+        :rtype: float
+        """
+        if isinstance(error, (GoneError, NotFoundError)):
+            raise error
         if attempt == self.max_retries - 1:
-            raise ChessComAPIError(
-                f"Unexpected error after retries: {error}"
-            ) from error
-        await asyncio.sleep(backoff_time)
+            raise ChessComAPIError("Max retries reached") from error
+        backoff_time = self.RETRY_BACKOFF_BASE * 2**attempt
+        if isinstance(error, RateLimitError) and error.retry_after is not None:
+            backoff_time = error.retry_after
+        backoff_time += random.uniform(0, self.RETRY_BACKOFF_JITTER)
+        logger.debug("%s. Retrying in %.2f seconds...", error, backoff_time)
+        return backoff_time
 
     # Player endpoints
-    async def get_player(self, username: str) -> Player:
+    async def get_player(self, username: str, use_cache: bool = True) -> Player:
         """Retrieve player information by username.
 
         This method fetches player data from a remote service and returns a Player
@@ -175,45 +751,181 @@ class ChessComClient:
 
         :param username: The username of the player to retrieve.
         :type username: str
+        :param use_cache: Serve repeat lookups from the entity cache, with
+            stale entries returned immediately and refreshed in the
+            background. Default is True.
+        :type use_cache: bool
         :return: A Player instance containing the player's information.
         :rtype: Player
         """
-        if not username.strip():
-            raise ValueError("Username cannot be empty")
-        data = await self._make_request(f"/player/{username}")
-        return Player.from_dict(data)
+        _require_nonempty(username=username)
+
+        async def fetch() -> Player:
+            data = await self._make_request(self._EP_PLAYER.format(username))
+            return Player.from_dict(data)
+
+        if not use_cache:
+            return await fetch()
+        return await self._get_entity(f"player:{username}", fetch)
+
+    async def get_players(self, usernames: Iterable[str]) -> Dict[str, Player]:
+        """Fetch several player profiles in one concurrent batch.
+
+        Duplicates are fetched only once; the requests run concurrently,
+        bounded by the client's rate limit, so hydrating N players costs
+        roughly one round trip instead of N sequential ones.
+
+        :param usernames: The usernames of the players to retrieve.
+        :type usernames: Iterable[str]
+        :return: A mapping of username to the fetched Player.
+        :rtype: Dict[str, Player]
+        """
+        unique = list(dict.fromkeys(usernames))
+        for username in unique:
+            _require_nonempty(username=username)
+        players = await asyncio.gather(
+            *(self.get_player(username) for username in unique)
+        )
+        return dict(zip(unique, players))
+
+    def load_player(self, username: str) -> "asyncio.Future[Player]":
+        """Enqueue a player lookup on the shared batch and return its future.
+
+        Lookups registered within the same batch window (a few milliseconds)
+        are flushed together as one concurrent batch, so model helpers such
+        as :meth:`White.fetch_user` that fire per instance coalesce into a
+        single wave of requests instead of N sequential round trips.
+
+        :param username: The username of the player to retrieve.
+        :type username: str
+        :return: A future resolving to the fetched Player.
+        :rtype: asyncio.Future[Player]
+        """
+        _require_nonempty(username=username)
+        loop = asyncio.get_running_loop()
+        future = self._pending_players.get(username)
+        if future is None:
+            future = loop.create_future()
+            self._pending_players[username] = future
+            if self._player_flush_task is None or self._player_flush_task.done():
+                self._player_flush_task = loop.create_task(self._flush_players())
+        return future
+
+    async def _flush_players(self) -> None:
+        """Resolve every queued player lookup with one concurrent batch.
+
+        Loops until the queue is empty: lookups enqueued while a batch is
+        already in flight land in the freshly swapped-in dict, and
+        :meth:`load_player` does not schedule a second flush task while this
+        one is alive, so they are drained by the next iteration here.
+        """
+        while self._pending_players:
+            await asyncio.sleep(self.PLAYER_BATCH_WINDOW)
+            pending, self._pending_players = self._pending_players, {}
+            results = await asyncio.gather(
+                *(self.get_player(username) for username in pending),
+                return_exceptions=True,
+            )
+            for future, result in zip(pending.values(), results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
 
     async def get_titled_players(self, title: str) -> List[str]:
         """Get list of titled players."""
-        data = await self._make_request(f"/titled/{title}")
-        if not isinstance(data, dict):
-            raise ChessComAPIError("Unexpected response from /titled endpoint")
-        if not isinstance(data["players"], list):
-            raise ChessComAPIError("Unexpected response from /titled endpoint")
-        return data["players"]
+        _require_nonempty(title=title)
+        return await self._get_list_field(self._EP_TITLED.format(title), "players")
+
+    async def _get_list_field(self, endpoint: str, key: str) -> List[Any]:
+        """Fetch an endpoint and return its single list field.
+
+        Endpoints such as ``/titled`` and ``/country/{iso}/players`` wrap one
+        large list in a single-key object; this extracts it in one pass
+        without re-validating the payload at every call site.
+
+        :param endpoint: The API endpoint relative to the base URL.
+        :type endpoint: str
+        :param key: The response key holding the list.
+        :type key: str
+        :return: The list stored under ``key``.
+        :rtype: List[Any]
+        """
+        data = await self._make_request(endpoint)
+        if not isinstance(data, dict) or not isinstance(data.get(key), list):
+            raise ChessComAPIError(f"Unexpected response from {endpoint} endpoint")
+        return data[key]
 
     async def get_player_stats(self, username: str) -> PlayerStats:
         """Get player statistics."""
-        data = await self._make_request(f"/player/{username}/stats")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_STATS.format(username))
         return PlayerStats.from_dict(data)
 
+    async def get_player_stats_bulk(
+        self,
+        usernames: Iterable[str],
+        on_error: Literal["skip", "yield", "raise"] = "yield",
+    ) -> AsyncIterator[Tuple[str, Union[PlayerStats, Exception]]]:
+        """Fetch statistics for many players, yielding results as they finish.
+
+        All requests are started at once (bounded by the client's rate limit)
+        and results stream back in completion order, so the first result
+        arrives after roughly one round trip instead of after the whole batch.
+
+        :param usernames: The usernames to fetch statistics for.
+        :type usernames: Iterable[str]
+        :param on_error: What to do when a fetch fails: ``"skip"`` drops the
+            entry, ``"yield"`` yields ``(username, exception)``, and
+            ``"raise"`` cancels the remaining fetches and re-raises.
+        :type on_error: Literal["skip", "yield", "raise"]
+        :return: An async iterator of ``(username, stats_or_exception)`` pairs.
+        :rtype: AsyncIterator[Tuple[str, Union[PlayerStats, Exception]]]
+        """
+
+        async def fetch(name: str) -> Tuple[str, Union[PlayerStats, Exception]]:
+            try:
+                return name, await self.get_player_stats(name)
+            except Exception as e:
+                return name, e
+
+        tasks = [asyncio.create_task(fetch(username)) for username in usernames]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                name, result = await completed
+                if isinstance(result, Exception):
+                    if on_error == "skip":
+                        continue
+                    if on_error == "raise":
+                        raise result
+                yield name, result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     async def get_player_current_games(self, username: str) -> List[Game]:
         """Get player's current games."""
-        data = await self._make_request(f"/player/{username}/games")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_GAMES.format(username))
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /player/games endpoint")
-        return [Game.from_dict(game) for game in data["games"]]
+        return Game.from_list(data["games"])
 
     async def get_player_to_move_games(self, username: str) -> List[DailyGame]:
         """Get player's games where it's their turn."""
-        data = await self._make_request(f"/player/{username}/games/to-move")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_GAMES_TO_MOVE.format(username))
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /player/games endpoint")
-        return [DailyGame.from_dict(game) for game in data["games"]]
+        return DailyGame.from_list(data["games"])
 
     async def get_player_game_archives(self, username: str) -> GameArchive:
         """Get URLs of player's game archives."""
-        data = await self._make_request(f"/player/{username}/games/archives")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_GAME_ARCHIVES.format(username))
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /player/games endpoint")
         return GameArchive.from_dict(
@@ -224,24 +936,151 @@ class ChessComClient:
         self, username: str, year: int, month: str
     ) -> List[BoardGame]:
         """Get player's archived games for a specific month."""
-        data = await self._make_request(f"/player/{username}/games/{year}/{month}")
+        _require_nonempty(username=username)
+        data = await self._make_request(
+            self._EP_PLAYER_ARCHIVE.format(username, year, month),
+            cache_ttl=self._archive_cache_ttl(year, month),
+        )
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /player/games endpoint")
         if not isinstance(data["games"], list):
             raise ChessComAPIError("Unexpected response from /player/games endpoint")
-        return [BoardGame.from_dict(game) for game in data["games"]]
+        return BoardGame.from_list(data["games"])
+
+    async def get_all_archived_games(self, username: str) -> List[BoardGame]:
+        """Get all of a player's archived games across every available month.
+
+        The monthly archive fetches are issued concurrently through
+        :meth:`get_archived_games`, bounded by the client's rate limit, instead
+        of one round trip per month. Months that fail to fetch are logged and
+        skipped.
+
+        :param username: The username of the player whose games to retrieve.
+        :type username: str
+        :return: All archived games, in archive order.
+        :rtype: List[BoardGame]
+        """
+        _require_nonempty(username=username)
+        archive = await self.get_player_game_archives(username)
+        months = []
+        for url in archive.archive_urls:
+            match = re.search(r"/games/(\d{4})/(\d{2})", url)
+            if match:
+                months.append((int(match.group(1)), match.group(2)))
+        results = await asyncio.gather(
+            *(self.get_archived_games(username, year, month) for year, month in months),
+            return_exceptions=True,
+        )
+        games: List[BoardGame] = []
+        for (year, month), result in zip(months, results):
+            if isinstance(result, BaseException):
+                logger.debug(
+                    "Skipping archive %d/%s for %s: %s", year, month, username, result
+                )
+                continue
+            games.extend(result)
+        return games
+
+    async def get_all_tournament_rounds(self, url_id: str) -> List[Round]:
+        """Get all rounds of a tournament, fetching them concurrently.
+
+        :param url_id: The URL identifier of the tournament.
+        :type url_id: str
+        :return: All fetched rounds of the tournament.
+        :rtype: List[Round]
+        """
+        _require_nonempty(url_id=url_id)
+        tournament = await self.get_tournament(url_id)
+        return await tournament.fetch_rounds(self)
 
     async def download_archived_games_pgn(
         self, file_name: str, username: str, year: int, month: int
     ) -> None:
         """Download player's multi-game PGN for a specific month."""
-        data = await self._make_request(
-            f"/player/{username}/games/{year}/{month}/pgn", bytestream=True
+        _require_nonempty(username=username)
+        await self._stream_to_file(
+            self._EP_PLAYER_ARCHIVE_PGN.format(username, year, month), file_name
         )
-        if not isinstance(data, bytes):
-            raise ChessComAPIError("Unexpected response from /player/games endpoint")
-        with open(file_name, "wb") as f:
-            f.write(data)
+
+    async def _stream_to_file(self, endpoint: str, file_name: str) -> None:
+        """Stream a binary response directly to a file on disk.
+
+        The response body is written chunk by chunk instead of being buffered
+        in memory first, so the working set stays constant regardless of how
+        large the download is.
+
+        :param endpoint: The API endpoint relative to the base URL.
+        :type endpoint: str
+        :param file_name: Path of the file to write the response body to.
+        :type file_name: str
+        """
+        url = self._base / endpoint.lstrip("/")
+        await self._acquire_slot()
+        try:
+            for attempt in range(self.max_retries):
+                try:
+                    if self._transport == "httpx":
+                        await self._stream_to_file_httpx(url, file_name)
+                        return
+                    async with self.session.get(
+                        url, headers=self._headers, timeout=self.timeout
+                    ) as response:
+                        if response.status != 200:
+                            await self._handle_http_error(response)
+                            raise ChessComAPIError(
+                                f"Request failed with status code {response.status}"
+                            )
+                        await self._write_chunks(
+                            response.content.iter_chunked(1 << 16), file_name
+                        )
+                        return
+                except asyncio.CancelledError:
+                    raise
+                except (
+                    *_TRANSPORT_ERRORS,
+                    asyncio.TimeoutError,
+                    ChessComAPIError,
+                ) as e:
+                    await asyncio.sleep(self._retry_delay(e, attempt))
+        finally:
+            await self._release_slot()
+
+    async def _stream_to_file_httpx(self, url: URL, file_name: str) -> None:
+        """Stream a binary response to a file over the HTTP/2 transport."""
+        client = self._get_httpx_client()
+        async with client.stream("GET", str(url)) as response:
+            if response.status_code != 200:
+                self._raise_for_status(
+                    response.status_code, response.headers, str(url)
+                )
+                raise ChessComAPIError(
+                    f"Request failed with status code {response.status_code}"
+                )
+            await self._write_chunks(response.aiter_bytes(1 << 16), file_name)
+
+    @staticmethod
+    async def _write_chunks(
+        chunks: AsyncIterator[bytes], file_name: str
+    ) -> None:
+        """Write a stream of response chunks to a file.
+
+        Uses ``aiofiles`` when installed so disk writes overlap with network
+        receive instead of blocking the event loop; otherwise falls back to
+        plain synchronous writes, which are short for 64 KiB chunks.
+
+        :param chunks: Asynchronous iterator over response body chunks.
+        :type chunks: AsyncIterator[bytes]
+        :param file_name: Path of the file to write the chunks to.
+        :type file_name: str
+        """
+        if aiofiles is not None:
+            async with aiofiles.open(file_name, "wb") as af:
+                async for chunk in chunks:
+                    await af.write(chunk)
+        else:
+            with open(file_name, "wb") as f:
+                async for chunk in chunks:
+                    f.write(chunk)
 
     async def get_game(
         self,
@@ -279,96 +1118,157 @@ class ChessComClient:
 
     async def get_player_clubs(self, username: str) -> List[UserClub]:
         """Get player's clubs."""
-        data = await self._make_request(f"/player/{username}/clubs")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_CLUBS.format(username))
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /player/clubs endpoint")
-        return [UserClub.from_dict(club) for club in data.get("clubs", [])]
+        from_dict = UserClub.from_dict
+        return [from_dict(club) for club in data.get("clubs", [])]
 
     async def get_player_matches(self, username: str) -> PlayerMatches:
         """Get player's team matches."""
-        data = await self._make_request(f"/player/{username}/matches")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_MATCHES.format(username))
         return PlayerMatches.from_dict(data)
 
     async def get_player_tournaments(self, username: str) -> PlayerTournaments:
         """Get player's tournaments."""
-        data = await self._make_request(f"/player/{username}/tournaments")
+        _require_nonempty(username=username)
+        data = await self._make_request(self._EP_PLAYER_TOURNAMENTS.format(username))
         return PlayerTournaments.from_dict(data)
 
     # Club endpoints
-    async def get_club(self, url_id: str) -> Club:
+    async def get_club(self, url_id: str, use_cache: bool = True) -> Club:
         """Get club details."""
-        data = await self._make_request(f"/club/{url_id}")
-        return Club.from_dict(data)
+        _require_nonempty(url_id=url_id)
+
+        async def fetch() -> Club:
+            data = await self._make_request(self._EP_CLUB.format(url_id))
+            return Club.from_dict(data)
+
+        if not use_cache:
+            return await fetch()
+        return await self._get_entity(f"club:{url_id}", fetch)
 
     async def get_club_members(self, url_id: str) -> Dict[str, List[str]]:
         """Get club members."""
-        data = await self._make_request(f"/club/{url_id}/members")
+        _require_nonempty(url_id=url_id)
+        data = await self._make_request(self._EP_CLUB_MEMBERS.format(url_id))
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /club/members endpoint")
         return data
 
     async def get_club_matches(self, url_id: str) -> ClubMatches:
         """Get club matches."""
-        data = await self._make_request(f"/club/{url_id}/matches")
+        _require_nonempty(url_id=url_id)
+        data = await self._make_request(self._EP_CLUB_MATCHES.format(url_id))
         return ClubMatches.from_dict(data)
 
     # Tournament endpoints
     async def get_tournament(self, url_id: str) -> Tournament:
         """Get tournament details."""
-        data = await self._make_request(f"/tournament/{url_id}")
+        _require_nonempty(url_id=url_id)
+        data = await self._make_request(self._EP_TOURNAMENT.format(url_id))
         return Tournament.from_dict(data)
 
     async def get_tournament_round(self, url_id: str, round_num: int) -> Round:
         """Get tournament round details."""
-        data = await self._make_request(f"/tournament/{url_id}/{round_num}")
-        return Round.from_dict(data)
+        _require_nonempty(url_id=url_id)
+
+        async def fetch() -> Round:
+            data = await self._make_request(
+                self._EP_TOURNAMENT_ROUND.format(url_id, round_num)
+            )
+            return Round.from_dict(data)
+
+        return await self._singleflight(f"round:{url_id}/{round_num}", fetch)
 
     async def get_tournament_round_group(
         self, url_id: str, round_num: int, group_num: int
     ) -> Group:
         """Get tournament round group details."""
-        data = await self._make_request(f"/tournament/{url_id}/{round_num}/{group_num}")
-        return Group.from_dict(data)
+        _require_nonempty(url_id=url_id)
+
+        async def fetch() -> Group:
+            data = await self._make_request(
+                self._EP_TOURNAMENT_ROUND_GROUP.format(url_id, round_num, group_num)
+            )
+            return Group.from_dict(data)
+
+        return await self._singleflight(
+            f"group:{url_id}/{round_num}/{group_num}", fetch
+        )
 
     # Match endpoints
-    async def get_match(self, match_id: int) -> Match:
-        """Get team match details."""
-        data = await self._make_request(f"/match/{match_id}")
-        return Match.from_dict(data)
+    async def get_match(self, match_id: int, use_cache: bool = True) -> Match:
+        """Get team match details.
+
+        Several club matches in one listing often point at the same match, so
+        results go through the entity cache to collapse the duplicate fetches.
+        """
+
+        async def fetch() -> Match:
+            data = await self._make_request(self._EP_MATCH.format(match_id))
+            return Match.from_dict(data)
+
+        if not use_cache:
+            return await fetch()
+        return await self._get_entity(f"match:{match_id}", fetch)
 
     async def get_match_board(self, match_id: int, board_num: int) -> Board:
         """Get team match board details."""
-        data = await self._make_request(f"/match/{match_id}/{board_num}")
+        data = await self._make_request(
+            self._EP_MATCH_BOARD.format(match_id, board_num)
+        )
         return Board.from_dict(data)
 
     async def get_live_match(self, match_id: str) -> Match:
         """Get live team match details."""
-        data = await self._make_request(f"/match/live/{match_id}")
+        _require_nonempty(match_id=match_id)
+        data = await self._make_request(self._EP_LIVE_MATCH.format(match_id))
         return Match.from_dict(data)
 
     async def get_live_match_board(self, match_id: int, board_num: int) -> Board:
         """Get live team match board details."""
-        data = await self._make_request(f"/match/live/{match_id}/{board_num}")
+        data = await self._make_request(
+            self._EP_LIVE_MATCH_BOARD.format(match_id, board_num)
+        )
         return Board.from_dict(data)
 
     # Country endpoints
-    async def get_country(self, iso_code: str) -> Country:
-        """Get country details."""
-        data = await self._make_request(f"/country/{iso_code}")
-        return Country.from_dict(data)
+    async def get_country(self, iso_code: str, use_cache: bool = True) -> Country:
+        """Get country details.
+
+        Countries are immutable reference data, so they are memoized for the
+        lifetime of the client rather than going through the TTL'd entity
+        cache; concurrent first lookups coalesce into one request.
+        """
+        _require_nonempty(iso_code=iso_code)
+
+        async def fetch() -> Country:
+            data = await self._make_request(self._EP_COUNTRY.format(iso_code))
+            return Country.from_dict(data)
+
+        if not use_cache:
+            return await fetch()
+        country = self._country_cache.get(iso_code)
+        if country is not None:
+            return country
+        country = await self._singleflight(f"country:{iso_code}", fetch)
+        self._country_cache[iso_code] = country
+        return country
 
     async def get_country_players(self, iso_code: str) -> List[str]:
         """Get country players."""
-        data = await self._make_request(f"/country/{iso_code}/players")
-        if not isinstance(data, dict):
-            raise ChessComAPIError("Unexpected response from /country/players endpoint")
-        if not isinstance(data["players"], list):
-            raise ChessComAPIError("Unexpected response from /country/players endpoint")
-        return data["players"]
+        _require_nonempty(iso_code=iso_code)
+        return await self._get_list_field(
+            self._EP_COUNTRY_PLAYERS.format(iso_code), "players"
+        )
 
     async def get_country_clubs(self, iso_code: str) -> CountryClubs:
         """Get country clubs."""
-        data = await self._make_request(f"/country/{iso_code}/clubs")
+        _require_nonempty(iso_code=iso_code)
+        data = await self._make_request(self._EP_COUNTRY_CLUBS.format(iso_code))
         return CountryClubs.from_dict(data)
 
     # Puzzle endpoints
@@ -388,7 +1288,8 @@ class ChessComClient:
         data = await self._make_request("/streamers")
         if not isinstance(data, dict):
             raise ChessComAPIError("Unexpected response from /streamers endpoint")
-        return [Streamer.from_dict(s) for s in data.get("streamers", [])]
+        from_dict = Streamer.from_dict
+        return [from_dict(s) for s in data.get("streamers", [])]
 
     async def get_leaderboards(self) -> Leaderboard:
         """Get Chess.com leaderboards."""
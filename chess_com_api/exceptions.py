@@ -4,6 +4,8 @@ This module defines custom exception classes used throughout the Chess.com API w
 to handle specific error scenarios and provide meaningful error messages.
 """
 
+from typing import Optional
+
 
 class ChessComAPIError(Exception):
     """Base exception for Chess.com API errors."""
@@ -14,7 +16,17 @@ class ChessComAPIError(Exception):
 class RateLimitError(ChessComAPIError):
     """Raised when API rate limit is exceeded."""
 
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """Store the server-suggested retry delay alongside the error message.
+
+        :param message: Human-readable description of the rate limit error.
+        :type message: str
+        :param retry_after: Seconds to wait before retrying, taken from the
+            ``Retry-After`` response header when the server provides one.
+        :type retry_after: Optional[float]
+        """
+        self.retry_after = retry_after
+        super().__init__(message)
 
 
 class NotFoundError(ChessComAPIError):
@@ -23,8 +35,12 @@ class NotFoundError(ChessComAPIError):
     pass
 
 
-class ValidationError(ChessComAPIError):
-    """Raised when input validation fails."""
+class ValidationError(ChessComAPIError, ValueError):
+    """Raised when input validation fails.
+
+    Also subclasses ``ValueError`` so callers that guarded against the plain
+    ``ValueError`` previously raised for empty input keep working.
+    """
 
     pass
 
@@ -7,11 +7,29 @@ statistics across various chess formats.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import random
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Union
+from functools import lru_cache, partial
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
 
 from chess_com_api.exceptions import RateLimitError
 
@@ -21,8 +39,218 @@ if TYPE_CHECKING:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if sys.version_info >= (3, 10):
+    # Slotted instances skip the per-object __dict__, which cuts memory by
+    # roughly half on the large Game/BoardGame lists built while parsing
+    # archives and speeds up attribute reads.
+    _dataclass = partial(dataclass, slots=True)
+else:  # pragma: no cover - slots need the 3.10 dataclass API
+    _dataclass = dataclass
 
-@dataclass
+# Bound once at import so the generated constructors skip the two-step
+# ``datetime`` -> ``fromtimestamp`` attribute walk on every record.
+_FROMTS = datetime.fromtimestamp
+
+
+def _intern_opt(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality optional string, passing None through."""
+    return None if value is None else sys.intern(value)
+
+
+# Comments, variations, and numeric annotation glyphs stripped from PGN
+# movetext before tokenizing; chess.com embeds clock times as comments.
+_PGN_NOISE = re.compile(r"\{[^}]*\}|\([^)]*\)|\$\d+")
+_PGN_RESULTS = frozenset({"1-0", "0-1", "1/2-1/2", "*"})
+
+
+def _parse_pgn_moves(pgn: str) -> List[str]:
+    """Tokenize PGN movetext into a list of SAN moves.
+
+    Tag-pair header lines, comments, variations, move numbers, and the game
+    result are dropped; what remains are the moves in standard algebraic
+    notation, in order.
+
+    :param pgn: The PGN text, with or without header tags.
+    :type pgn: str
+    :return: The moves in standard algebraic notation.
+    :rtype: List[str]
+    """
+    movetext = " ".join(
+        line for line in pgn.splitlines() if not line.startswith("[")
+    )
+    movetext = _PGN_NOISE.sub(" ", movetext)
+    return [
+        token
+        for token in movetext.split()
+        if not token[0].isdigit() and token not in _PGN_RESULTS
+    ]
+
+# Bounds for the model-level bulk fetchers. The client applies its own
+# admission control underneath; the semaphore keeps any single fetch_* burst
+# from monopolizing it, and the backoff grows exponentially with jitter so
+# retries after a 429 do not arrive in lockstep.
+_FETCH_CONCURRENCY = 25
+_FETCH_MAX_RETRIES = 3
+_FETCH_BACKOFF_BASE = 2.0
+
+# Normalized shape of one streamer platform row; Streamer.from_dict fills
+# missing keys from these defaults in a single pass over the table.
+_PLATFORM_DEFAULTS = (
+    ("type", ""),
+    ("stream_url", ""),
+    ("channel_url", ""),
+    ("is_live", False),
+    ("is_main_live_platform", False),
+)
+
+_T = TypeVar("_T")
+
+
+class _LazyList(Sequence[_T]):
+    """List-like view over payload rows, parsing each item on first access.
+
+    Container endpoints such as tournament round groups can carry hundreds of
+    game dictionaries of which callers often inspect only a few. Instead of
+    materializing every model up front, the raw rows are kept as-is and run
+    through ``parse`` on ``__getitem__``, with the result memoized so repeat
+    access stays O(1). Iteration and ``len`` behave like a plain list.
+
+    :ivar _rows: The raw payload dictionaries backing the sequence.
+    :ivar _parse: Callable turning one payload row into a model instance.
+    :ivar _items: Memoized parsed instances, ``None`` until first access.
+    """
+
+    __slots__ = ("_rows", "_parse", "_items")
+
+    def __init__(self, rows: List[Dict[str, Any]], parse: Callable[..., _T]):
+        """Wrap ``rows`` for lazy parsing through ``parse``.
+
+        :param rows: The payload dictionaries to parse on demand.
+        :type rows: List[Dict[str, Any]]
+        :param parse: Constructor applied to a row on first access, typically
+            a model's ``from_dict``.
+        :type parse: Callable[..., _T]
+        """
+        self._rows = rows
+        self._parse = parse
+        self._items: List[Optional[_T]] = [None] * len(rows)
+
+    def __len__(self) -> int:
+        """Return the number of rows in the sequence."""
+        return len(self._rows)
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return the parsed item at ``index``, parsing and memoizing it once."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._rows)))]
+        item = self._items[index]
+        if item is None:
+            item = self._parse(self._rows[index])
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[_T]:
+        """Yield parsed items in order."""
+        for i in range(len(self._rows)):
+            yield self[i]
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare by parsed contents so equality matches a plain list."""
+        if isinstance(other, (list, _LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Render like the list of parsed items."""
+        return repr(list(self))
+
+
+def _compile_from_dict(
+    cls: type,
+    fields: List[tuple],
+    post: Optional[List[tuple]] = None,
+    pre: Optional[List[str]] = None,
+    error_message: str = "Invalid input data. Expected a dictionary.",
+) -> None:
+    """Generate and bind an inlined ``from_dict`` constructor onto ``cls``.
+
+    Each ``fields`` entry pairs a constructor keyword with the source
+    expression that pulls it out of the payload dictionary ``data``. The
+    expressions are compiled into one flat function at import time, so
+    parsing a payload costs a single call with every dict lookup inlined and
+    ``datetime.fromtimestamp`` hoisted into the local ``_ft``. ``pre``
+    statements run before construction and can hoist shared sub-dicts into
+    locals; ``post`` entries assign computed attributes after construction.
+
+    When the spec lists fields in the same order as the class constructor,
+    the generated call passes them positionally, skipping the keyword
+    matching CPython performs for every keyword-argument call.
+
+    :param cls: The model class to bind the generated constructor to.
+    :type cls: type
+    :param fields: Pairs of constructor keyword and extraction expression.
+    :type fields: List[tuple]
+    :param post: Attribute assignments applied to the new instance.
+    :type post: Optional[List[tuple]]
+    :param pre: Statements executed before the constructor call.
+    :type pre: Optional[List[str]]
+    :param error_message: Message raised when ``data`` is not a dictionary.
+    :type error_message: str
+    """
+    parameters = list(inspect.signature(cls).parameters)
+    if [name for name, _ in fields] == parameters[: len(fields)]:
+        args = ", ".join(expr for _, expr in fields)
+    else:
+        args = ", ".join(f"{name}={expr}" for name, expr in fields)
+    lines = [
+        "def from_dict(data, _cls=cls, _ft=_FROMTS):",
+        "    if not isinstance(data, dict):",
+        f"        raise ValueError({error_message!r})",
+    ]
+    if pre:
+        lines.extend(f"    {stmt}" for stmt in pre)
+    if post:
+        lines.append(f"    obj = _cls({args})")
+        lines.extend(f"    obj.{attr} = {expr}" for attr, expr in post)
+        lines.append("    return obj")
+    else:
+        lines.append(f"    return _cls({args})")
+    source = "\n".join(lines)
+    namespace: Dict[str, Any] = {"cls": cls}
+    exec(  # noqa: S102
+        compile(source, f"<from_dict:{cls.__name__}>", "exec"), globals(), namespace
+    )
+    from_dict = namespace["from_dict"]
+    from_dict.__doc__ = (
+        f"Create a :class:`{cls.__name__}` instance from a dictionary.\n\n"
+        ":param data: The data dictionary containing the instance fields.\n"
+        ":type data: Dict\n"
+        f":return: A new {cls.__name__} instance.\n"
+        f":rtype: {cls.__name__}\n"
+    )
+    cls.from_dict = staticmethod(from_dict)  # type: ignore[attr-defined]
+
+    bulk_source = (
+        "def from_list(rows, _from_dict=from_dict):\n"
+        "    return [_from_dict(row) for row in rows]"
+    )
+    exec(  # noqa: S102
+        compile(bulk_source, f"<from_list:{cls.__name__}>", "exec"),
+        globals(),
+        namespace,
+    )
+    from_list = namespace["from_list"]
+    from_list.__doc__ = (
+        f"Create a list of :class:`{cls.__name__}` instances from payload rows.\n\n"
+        ":param rows: The payload dictionaries to parse.\n"
+        ":type rows: Iterable[Dict]\n"
+        f":return: The parsed {cls.__name__} instances.\n"
+        f":rtype: List[{cls.__name__}]\n"
+    )
+    cls.from_list = staticmethod(from_list)  # type: ignore[attr-defined]
+
+
+@_dataclass
 class Player:
     """Representation of a player, encapsulating their details and behaviors.
 
@@ -49,10 +277,10 @@ class Player:
     :type country_url: str
     :ivar _country: The fetched country information of the player.
     :type _country: Optional[Country]
-    :ivar joined: Timestamp when the player joined.
-    :type joined: datetime
-    :ivar last_online: Timestamp when the player was last online.
-    :type last_online: datetime
+    :ivar joined_ts: Unix timestamp of when the player joined.
+    :type joined_ts: int
+    :ivar last_online_ts: Unix timestamp of when the player was last online.
+    :type last_online_ts: int
     :ivar followers: Number of followers the player has.
     :type followers: int
     :ivar is_streamer: Indicates whether the player is a streamer.
@@ -72,46 +300,34 @@ class Player:
     location: Optional[str]
     country_url: str
     _country: Optional[Country] = field(default=None, init=False, repr=False)
-    joined: datetime
-    last_online: datetime
+    joined_ts: int
+    last_online_ts: int
     followers: int
     is_streamer: bool = False
     twitch_url: Optional[str] = None
     fide: Optional[int] = None
+    _joined: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_online: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     # TODO: Add streaming_platforms
 
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Player":
-        """Create a Player instance from a dictionary.
-
-        This method initializes a new Player object using the provided dictionary data,
-        extracting and mapping the relevant fields to the Player's attributes.
+    @property
+    def joined(self) -> datetime:
+        """Return the join timestamp as a ``datetime``, built on first access."""
+        if self._joined is None:
+            self._joined = _FROMTS(self.joined_ts)
+        return self._joined
 
-        :param data: The data dictionary containing player details.
-        :type data: Dict
-        :return: A new Player instance.
-        :rtype: Player
-        """
-        if isinstance(data, Dict):
-            return cls(
-                username=data["username"],
-                player_id=data["player_id"],
-                title=data.get("title"),
-                status=data["status"],
-                name=data.get("name"),
-                avatar=data.get("avatar"),
-                location=data.get("location"),
-                country_url=data["country"],
-                joined=datetime.fromtimestamp(data["joined"]),
-                last_online=datetime.fromtimestamp(data["last_online"]),
-                followers=data["followers"],
-                is_streamer=data.get("is_streamer", False),
-                twitch_url=data.get("twitch_url"),
-                fide=data.get("fide"),
-            )
-        else:
-            raise ValueError("Invalid input. Expected a dictionary.")
+    @property
+    def last_online(self) -> datetime:
+        """Return the last-online timestamp as a ``datetime``, built on first access."""
+        if self._last_online is None:
+            self._last_online = _FROMTS(self.last_online_ts)
+        return self._last_online
 
     async def fetch_country(self, client: ChessComClient) -> "Country":
         """Fetch country information for the given client.
@@ -126,7 +342,7 @@ class Player:
         :rtype: Country
         """
         self._country = await client.get_country(
-            iso_code=self.country_url.split("/")[-1]
+            iso_code=self.country_url.rpartition("/")[2]
         )
         return self._country
 
@@ -150,7 +366,47 @@ class Player:
         return self._country
 
 
-@dataclass
+@_dataclass
+class TimeControlStats:
+    """Statistics for one chess time control, flattened from the API payload.
+
+    The API nests each time control's stats under ``last``, ``best``, and
+    ``record`` sub-dictionaries. This class hoists the commonly read values
+    into slotted attributes so hot paths computing ratings or win rates use
+    plain attribute loads instead of repeated dict lookups and string hashing.
+
+    :ivar last_rating: Current rating, if present.
+    :type last_rating: Optional[int]
+    :ivar last_date_ts: Unix timestamp of the latest rated game.
+    :type last_date_ts: Optional[int]
+    :ivar last_rd: Glicko rating deviation of the current rating.
+    :type last_rd: Optional[int]
+    :ivar best_rating: Highest rating achieved, if present.
+    :type best_rating: Optional[int]
+    :ivar best_date_ts: Unix timestamp of the highest rating.
+    :type best_date_ts: Optional[int]
+    :ivar best_game: URL of the game that produced the highest rating.
+    :type best_game: Optional[str]
+    :ivar record_win: Number of games won.
+    :type record_win: int
+    :ivar record_loss: Number of games lost.
+    :type record_loss: int
+    :ivar record_draw: Number of games drawn.
+    :type record_draw: int
+    """
+
+    last_rating: Optional[int]
+    last_date_ts: Optional[int]
+    last_rd: Optional[int]
+    best_rating: Optional[int]
+    best_date_ts: Optional[int]
+    best_game: Optional[str]
+    record_win: int = 0
+    record_loss: int = 0
+    record_draw: int = 0
+
+
+@_dataclass
 class PlayerStats:
     """Represents the statistics of a player in various chess formats.
 
@@ -160,15 +416,15 @@ class PlayerStats:
     to instantiate an instance from a dictionary.
 
     :ivar chess_daily: Statistics for daily chess games.
-    :type chess_daily: Optional[Dict]
+    :type chess_daily: Optional[TimeControlStats]
     :ivar chess_rapid: Statistics for rapid chess games.
-    :type chess_rapid: Optional[Dict]
+    :type chess_rapid: Optional[TimeControlStats]
     :ivar chess_bullet: Statistics for bullet chess games.
-    :type chess_bullet: Optional[Dict]
+    :type chess_bullet: Optional[TimeControlStats]
     :ivar chess_blitz: Statistics for blitz chess games.
-    :type chess_blitz: Optional[Dict]
+    :type chess_blitz: Optional[TimeControlStats]
     :ivar chess960_daily: Statistics for daily chess960 games.
-    :type chess960_daily: Optional[Dict]
+    :type chess960_daily: Optional[TimeControlStats]
     :ivar tactics: Statistics for tactics training.
     :type tactics: Optional[Dict]
     :ivar lessons: Statistics for lessons taken.
@@ -177,11 +433,11 @@ class PlayerStats:
     :type puzzle_rush: Optional[Dict]
     """
 
-    chess_daily: Optional[Dict[str, Any]]
-    chess_rapid: Optional[Dict[str, Any]]
-    chess_bullet: Optional[Dict[str, Any]]
-    chess_blitz: Optional[Dict[str, Any]]
-    chess960_daily: Optional[Dict[str, Any]]
+    chess_daily: Optional[TimeControlStats]
+    chess_rapid: Optional[TimeControlStats]
+    chess_bullet: Optional[TimeControlStats]
+    chess_blitz: Optional[TimeControlStats]
+    chess960_daily: Optional[TimeControlStats]
     tactics: Optional[Dict[str, Any]]
     lessons: Optional[Dict[str, Any]]
     puzzle_rush: Optional[Dict[str, Any]]
@@ -190,8 +446,9 @@ class PlayerStats:
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "PlayerStats":
         """Create a PlayerStats instance from a dictionary.
 
-        This method extracts relevant keys from a dictionary to create
-        an instance of the PlayerStats class.
+        The per-time-control sections are parsed into
+        :class:`TimeControlStats`; the tactics, lessons, and puzzle rush
+        sections have unrelated shapes and are passed through as-is.
 
         :param data: A dictionary containing the player's statistics.
         :type data: Dict
@@ -199,12 +456,18 @@ class PlayerStats:
         :rtype: PlayerStats
         """
         if isinstance(data, dict):
+            tc = TimeControlStats.from_dict
+
+            def section(key: str) -> Optional[TimeControlStats]:
+                value = data.get(key)
+                return tc(value) if value else None
+
             return cls(
-                chess_daily=data.get("chess_daily"),
-                chess_rapid=data.get("chess_rapid"),
-                chess_bullet=data.get("chess_bullet"),
-                chess_blitz=data.get("chess_blitz"),
-                chess960_daily=data.get("chess960_daily"),
+                chess_daily=section("chess_daily"),
+                chess_rapid=section("chess_rapid"),
+                chess_bullet=section("chess_bullet"),
+                chess_blitz=section("chess_blitz"),
+                chess960_daily=section("chess960_daily"),
                 tactics=data.get("tactics"),
                 lessons=data.get("lessons"),
                 puzzle_rush=data.get("puzzle_rush"),
@@ -213,7 +476,7 @@ class PlayerStats:
             raise ValueError("Invalid input data. Expected a dictionary.")
 
 
-@dataclass
+@_dataclass
 class DailyGame:
     """Class representing a daily game with its details.
 
@@ -223,55 +486,49 @@ class DailyGame:
 
     :ivar url: URL of the daily game.
     :type url: str
-    :ivar move_by: Time by which a move must be made.
-    :type move_by: datetime
-    :ivar last_activity: Timestamp of the last activity in the game.
-    :type last_activity: datetime
+    :ivar move_by_ts: Unix timestamp by which a move must be made.
+    :type move_by_ts: int
+    :ivar last_activity_ts: Unix timestamp of the last activity in the game.
+    :type last_activity_ts: int
     :ivar draw_offer: Indicates whether a draw offer is present.
     :type draw_offer: Optional[bool]
     """
 
     url: str
-    move_by: datetime
-    last_activity: datetime
+    move_by_ts: int
+    last_activity_ts: int
     draw_offer: Optional[bool] = None
+    _move_by: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_activity: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "DailyGame":
-        """Create an instance of DailyGame from a dictionary.
-
-        This method constructs and returns an instance of DailyGame by parsing the input
-        dictionary. If the "draw_offer" key exists, it checks the value of "move_by" and
-        "draw_offer" but does not alter the creation process based on these checks.
+    @property
+    def move_by(self) -> datetime:
+        """Return the move-by deadline as a ``datetime``, built on first access."""
+        if self._move_by is None:
+            self._move_by = _FROMTS(self.move_by_ts)
+        return self._move_by
 
-        :param data: Dictionary containing the necessary data to
-         instantiate a DailyGame.
-        :type data: Dict
-        :return: A new instance of DailyGame initialized with the given data.
-        :rtype: DailyGame
-        """
-        if isinstance(data, dict):
-            if "draw_offer" in data.keys():
-                if data["move_by"] == 0 or data["draw_offer"]:
-                    pass
-            return cls(
-                url=data["url"],
-                move_by=datetime.fromtimestamp(data["move_by"]),
-                last_activity=datetime.fromtimestamp(data["last_activity"]),
-                draw_offer=False,
-            )
-        else:
-            raise ValueError("Invalid input data. Expected a dictionary.")
+    @property
+    def last_activity(self) -> datetime:
+        """Return the last activity as a ``datetime``, built on first access."""
+        if self._last_activity is None:
+            self._last_activity = _FROMTS(self.last_activity_ts)
+        return self._last_activity
 
 
-@dataclass
-class White:
-    """Represent a player who plays the white pieces in a chess game.
+@_dataclass
+class GamePlayer:
+    """Represent one side of a chess game, white or black.
 
-    This class encapsulates the details of a player using the white pieces,
+    This class encapsulates the details of the player on one side of a game,
     including their rating, game result, URL, username, and unique identifier.
     It also provides functionality to fetch and store detailed player information
-    using an asynchronous client.
+    using an asynchronous client. The same class serves both colors; ``White``
+    and ``Black`` remain as aliases for code written against the old names.
 
     :ivar rating: The player's rating.
     :type rating: int
@@ -292,26 +549,6 @@ class White:
     uuid: str
     _user: Optional[Player] = field(default=None, init=False, repr=False)
 
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "White":
-        """Create an instance of the class from a dictionary.
-
-        :param data: The dictionary containing the instance data.
-        :type data: Dict
-        :return: An instance of the class with attributes populated from the dictionary.
-        :rtype: White
-        """
-        if isinstance(data, dict):
-            return cls(
-                rating=data["rating"],
-                result=data["result"],
-                user_url=data["@id"],
-                username=data["username"],
-                uuid=data["uuid"],
-            )
-        else:
-            raise ValueError("Invalid input data. Expected a dictionary.")
-
     async def fetch_user(self, client: ChessComClient) -> "Player":
         """Fetch user data from the Chess.com API.
 
@@ -325,7 +562,7 @@ class White:
         :rtype: Player
         """
         if self._user is None:
-            self._user = await client.get_player(username=self.username)
+            self._user = await client.load_player(self.username)
         return self._user
 
     @property
@@ -346,92 +583,14 @@ class White:
         return self._user
 
 
-@dataclass
-class Black:
-    """Represents a chess player with specific attributes for black pieces.
-
-    Detailed description of the class, its purpose, and usage. This class includes
-    the player's rating, result, user URL, username, and unique identifier. It also
-    supports fetching a Player object through an asynchronous API call.
-
-    :ivar rating: Player's rating.
-    :type rating: int
-    :ivar result: Game result.
-    :type result: str
-    :ivar user_url: URL to the user's profile.
-    :type user_url: str
-    :ivar username: Player's username.
-    :type username: str
-    :ivar uuid: Player's unique identifier.
-    :type uuid: str
-    :ivar _user: Cache for the player's detailed data.
-    :type _user: Optional[Player]
-    """
-
-    rating: int
-    result: str
-    user_url: str
-    username: str
-    uuid: str
-    _user: Optional[Player] = field(default=None, init=False, repr=False)
-
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Black":
-        """Create an instance of the class `Black` from a dictionary.
-
-        This method initializes a `Black` instance using data from a dictionary. The
-        dictionary should contain keys such as 'rating', 'result', '@id', 'username',
-        and 'uuid' to map correctly to the properties of the `Black` class.
-
-        :param data: Dictionary containing user data.
-        :type data: Dict
-        :return: Instance of `Black` initialized with data from the dictionary.
-        :rtype: Black
-        """
-        if isinstance(data, dict):
-            return cls(
-                rating=data["rating"],
-                result=data["result"],
-                user_url=data["@id"],
-                username=data["username"],
-                uuid=data["uuid"],
-            )
-        else:
-            raise ValueError("Invalid input data. Expected a dictionary.")
-
-    async def fetch_user(self, client: ChessComClient) -> "Player":
-        """Fetch user information asynchronously from Chess.com client.
-
-        This method retrieves user information using the Chess.com client. If the
-        user information has been previously fetched, it returns the cached data
-        instead of making a new request.
-
-        :param client: Chess.com client used to fetch player information.
-        :type client: ChessComClient
-        :return: Player object with user information.
-        :rtype: Player
-        """
-        if self._user is None:
-            self._user = await client.get_player(username=self.username)
-        return self._user
-
-    @property
-    def user(self) -> "Player":
-        """Get the user associated with this instance.
-
-        :return: The user associated with this instance.
-        :rtype: Player
-        :raises ValueError: If the user has not been fetched and `_user` is None.
-        """
-        if self._user is None:
-            raise ValueError(
-                "User has not been fetched. Call `fetch_user` with an API client first."
-            )
-        return self._user
+# Deprecated aliases kept for one release; the classes were identical and are
+# now a single implementation.
+White = GamePlayer
+Black = GamePlayer
 
 
 # TODO: Update Doc
-@dataclass
+@_dataclass
 class Game:
     """Represents a chess game and provides methods to interact with game details.
 
@@ -493,54 +652,13 @@ class Game:
     end_time: Optional[int] = None
     _black: Optional[Player] = field(default=None, init=False, repr=False)
     _white: Optional[Player] = field(default=None, init=False, repr=False)
+    _moves: Optional[List[str]] = field(default=None, init=False, repr=False)
     id: Optional[int] = None
     pgn: Optional[str] = None
     tcn: Optional[str] = None
     initial_setup: Optional[str] = None
     uuid: Optional[str] = None
 
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Game":
-        """Convert a dictionary to a Game instance.
-
-        Detailed description of how this class method converts the provided
-        dictionary to an instance of the Game class by mapping dictionary keys to
-        instance attributes.
-
-        :param data: Dictionary containing game details. Keys should include 'white',
-         'black', 'url', 'fen', 'pgn', 'time_control', 'time_class', 'rules',
-         and optionally 'rated', 'accuracies', 'tournament', 'match', 'eco',
-         'start_time', and 'end_time'.
-        :type data: Dict
-        :return: An instance of the Game class populated with the provided
-         dictionary data.
-        :rtype: Game
-        """
-        if isinstance(data, dict):
-            return cls(
-                white_url=data["white"],
-                black_url=data["black"],
-                url=data["url"],
-                fen=data["fen"],
-                time_control=data["time_control"],
-                time_class=data["time_class"],
-                rules=data["rules"],
-                rated=data.get("rated", False),
-                accuracies=data.get("accuracies"),
-                tournament=data.get("tournament"),
-                match=data.get("match"),
-                eco=data.get("eco"),
-                start_time=data.get("start_time"),
-                end_time=data.get("end_time"),
-                id=int(data["url"].split("/")[-1]),
-                pgn=data.get("pgn"),
-                tcn=data.get("tcn"),
-                initial_setup=data.get("initial_setup"),
-                uuid=data.get("uuid"),
-            )
-        else:
-            raise ValueError("Invalid input data. Expected a dictionary.")
-
     async def fetch_white(self, client: ChessComClient) -> "Player":
         """Fetch the player information for the white player using the provided client.
 
@@ -553,7 +671,7 @@ class Game:
         :return: The `Player` object containing the white player's information.
         :rtype: Player
         """
-        self._white = await client.get_player(username=self.white_url.split("/")[-1])
+        self._white = await client.load_player(self.white_url.rpartition("/")[2])
         return self._white
 
     async def fetch_black(self, client: ChessComClient) -> "Player":
@@ -569,7 +687,7 @@ class Game:
         :return: The details of the black player.
         :rtype: dict
         """
-        self._black = await client.get_player(username=self.black_url.split("/")[-1])
+        self._black = await client.load_player(self.black_url.rpartition("/")[2])
         return self._black
 
     @property
@@ -610,6 +728,24 @@ class Game:
             )
         return self._black
 
+    @property
+    def moves(self) -> "List[str]":
+        """Get the SAN moves parsed from the PGN movetext.
+
+        Parsing is deferred until first access and memoized per instance, so
+        games that are never analyzed pay no tokenization cost and repeated
+        reads return the same list.
+
+        :raises ValueError: If the game carries no PGN.
+        :return: The moves in standard algebraic notation.
+        :rtype: List[str]
+        """
+        if self._moves is None:
+            if self.pgn is None:
+                raise ValueError("Game has no PGN to parse moves from.")
+            self._moves = _parse_pgn_moves(self.pgn)
+        return self._moves
+
     def __eq__(self, other: Any) -> bool:
         """Check equality based on game attributes."""
         if not isinstance(other, Game):
@@ -641,7 +777,7 @@ class Game:
         )
 
 
-@dataclass
+@_dataclass
 class GameArchive:
     """Represents a game archive."""
 
@@ -796,7 +932,7 @@ class GameArchive:
         return list(self._games)
 
 
-@dataclass
+@_dataclass
 class UserClub:
     """Represents a user club with details about club ID, name, and activity.
 
@@ -808,73 +944,45 @@ class UserClub:
     :type club_id: str
     :ivar name: Name of the club.
     :type name: str
-    :ivar last_activity: Timestamp of the last activity in the club.
-    :type last_activity: datetime
+    :ivar last_activity_ts: Unix timestamp of the last activity in the club.
+    :type last_activity_ts: int
     :ivar icon: URL of the club's icon.
     :type icon: str
     :ivar url: URL of the club's homepage.
     :type url: str
-    :ivar joined: Timestamp of when the user joined the club.
-    :type joined: datetime
+    :ivar joined_ts: Unix timestamp of when the user joined the club.
+    :type joined_ts: int
     """
 
-    def __init__(
-        self,
-        club_id: str,
-        name: str,
-        last_activity: datetime,
-        icon: str,
-        url: str,
-        joined: datetime,
-    ):
-        """Initialize the club with the given details.
-
-        :param club_id: Unique identifier for the club.
-        :type club_id: str
-        :param name: Name of the club.
-        :type name: str
-        :param last_activity: Timestamp of the last activity in the club.
-        :type last_activity: datetime
-        :param icon: URL of the club's icon.
-        :type icon: str
-        :param url: URL of the club's homepage.
-        :type url: str
-        :param joined: Timestamp of when the user joined the club.
-        :type joined: datetime
-        """
-        self.club_id = club_id
-        self.name = name
-        self.last_activity = last_activity
-        self.icon = icon
-        self.url = url
-        self.joined = joined
-
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "UserClub":
-        """Create an instance of UserClub from a dictionary.
+    club_id: str
+    name: str
+    last_activity_ts: int
+    icon: str
+    url: str
+    joined_ts: int
+    _last_activity: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _joined: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-        This class method takes a dictionary containing club data and returns an
-        instance of UserClub with the corresponding attributes.
+    @property
+    def last_activity(self) -> datetime:
+        """Return the last activity as a ``datetime``, built on first access."""
+        if self._last_activity is None:
+            self._last_activity = _FROMTS(self.last_activity_ts)
+        return self._last_activity
 
-        :param data: A dictionary containing the club data.
-        :type data: Dict
-        :return: An instance of UserClub with attributes populated
-         from the dictionary data.
-        :rtype: UserClub
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            club_id=data.get("@id", ""),  # Use "@id" for the unique identifier
-            name=data.get("name", ""),
-            last_activity=datetime.fromtimestamp(data.get("last_activity", 0)),
-            icon=data.get("icon", ""),
-            url=data.get("url", ""),
-            joined=datetime.fromtimestamp(data.get("joined", 0)),
-        )
+    @property
+    def joined(self) -> datetime:
+        """Return the join timestamp as a ``datetime``, built on first access."""
+        if self._joined is None:
+            self._joined = _FROMTS(self.joined_ts)
+        return self._joined
 
 
-@dataclass
+@_dataclass
 class Club:
     """Represents a club with various attributes.
 
@@ -894,10 +1002,10 @@ class Club:
     :type average_daily_rating: int
     :ivar members_count: Number of members in the club.
     :type members_count: int
-    :ivar created: Timestamp of when the club was created.
-    :type created: datetime
-    :ivar last_activity: Timestamp of the last activity in the club.
-    :type last_activity: datetime
+    :ivar created_ts: Unix timestamp of when the club was created.
+    :type created_ts: int
+    :ivar last_activity_ts: Unix timestamp of the last activity in the club.
+    :type last_activity_ts: int
     :ivar admin: List of administrators of the club.
     :type admin: List[str]
     :ivar visibility: Visibility status of the club.
@@ -918,49 +1026,37 @@ class Club:
     country: str
     average_daily_rating: int
     members_count: int
-    created: datetime
-    last_activity: datetime
+    created_ts: int
+    last_activity_ts: int
     admin: List[str] = field(default_factory=list)
     visibility: str = ""
     join_request: str = ""
     icon: str = ""
     description: str = ""
     url: str = ""
+    _created: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_activity: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Club":
-        """Create an instance of Club from a dictionary.
-
-        Given a dictionary with keys and values corresponding to attributes of the
-        Club class, instantiate and return a new Club object. Default values are
-        provided for keys that are missing in the dictionary.
+    @property
+    def created(self) -> datetime:
+        """Return the creation timestamp as a ``datetime``, built on first access."""
+        if self._created is None:
+            self._created = _FROMTS(self.created_ts)
+        return self._created
 
-        :param data: Dictionary containing Club attributes.
-        :type data: Dict
-        :return: A new instance of Club.
-        :rtype: Club
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            id=data.get("@id", ""),
-            name=data.get("name", ""),
-            club_id=data.get("club_id", 0),
-            country=data.get("country", ""),
-            average_daily_rating=data.get("average_daily_rating", 0),
-            members_count=data.get("members_count", 0),
-            created=datetime.fromtimestamp(data.get("created", 0)),
-            last_activity=datetime.fromtimestamp(data.get("last_activity", 0)),
-            admin=data.get("admin", []),
-            visibility=data.get("visibility", ""),
-            join_request=data.get("join_request", ""),
-            icon=data.get("icon", ""),
-            description=data.get("description", ""),
-            url=data.get("url", ""),
-        )
+    @property
+    def last_activity(self) -> datetime:
+        """Return the last activity as a ``datetime``, built on first access."""
+        if self._last_activity is None:
+            self._last_activity = _FROMTS(self.last_activity_ts)
+        return self._last_activity
 
 
-@dataclass
+@_dataclass
 class CountryClubs:
     """Holds information related to country clubs and fetches club from an external API.
 
@@ -1010,36 +1106,42 @@ class CountryClubs:
         :rtype: List[Club]
         """
         self._clubs = self._clubs or []
-        seen_club_ids = {club.id.split("/")[-1] for club in self._clubs}
+        seen_club_ids = {club.id.rpartition("/")[2] for club in self._clubs}
+
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
 
         async def fetch_club(club_url: str) -> Optional[Club]:
-            club_id = club_url.split("/")[-1]
+            club_id = club_url.rpartition("/")[2]
             if club_id in seen_club_ids:
                 return None  # Skip already fetched clubs
-            try:
-                print(f"Fetching club with ID: {club_id}")
-                club = await client.get_club(url_id=club_id)
-                if club:
-                    seen_club_ids.add(club.id.split("/")[-1])
-                return club
-            except RateLimitError:
-                print(f"Rate limit hit while fetching club {club_id}. Retrying...")
-                await asyncio.sleep(2)  # Retry after fixed backoff
-                return await fetch_club(
-                    club_url
-                )  # Retry logic already in `_make_request`
-            except Exception as e:
-                print(f"Error fetching club {club_id}: {e}")
-                return None
-
-        # Fetch club details concurrently
-        tasks = [fetch_club(club_url) for club_url in self.club_urls]
-        fetched_clubs = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Add unique clubs to `_clubs`
-        for club in filter(None, fetched_clubs):  # Filter out None values and errors
-            if isinstance(club, Club):
-                print(f"Fetched club: {club.name}")
+            for attempt in range(_FETCH_MAX_RETRIES):
+                try:
+                    logger.debug("Fetching club with ID: %s", club_id)
+                    async with semaphore:
+                        club = await client.get_club(url_id=club_id)
+                    if club:
+                        seen_club_ids.add(club.id.rpartition("/")[2])
+                    return club
+                except RateLimitError:
+                    delay = _FETCH_BACKOFF_BASE * 2**attempt + random.uniform(0, 1)
+                    logger.debug(
+                        "Rate limit hit while fetching club %s. "
+                        "Retrying in %.1fs...",
+                        club_id,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    logger.debug("Error fetching club %s: %s", club_id, e)
+                    return None
+            return None
+
+        # Stream results as they finish instead of buffering the whole batch.
+        coros = [fetch_club(club_url) for club_url in self.club_urls]
+        for completed in asyncio.as_completed(coros):
+            club = await completed
+            if club is not None:
+                logger.debug("Fetched club: %s", club.name)
                 self._clubs.append(club)
 
         return self._clubs
@@ -1064,7 +1166,7 @@ class CountryClubs:
         return self._clubs
 
 
-@dataclass
+@_dataclass
 class Group:
     """Represents a group of games and their fair play removals.
 
@@ -1073,12 +1175,12 @@ class Group:
 
     :ivar fair_play_removals: List of fair play removals.
     :type fair_play_removals: List[str]
-    :ivar games: List of games in the group.
-    :type games: List[Game]
+    :ivar games: Games in the group, parsed lazily on access.
+    :type games: Sequence[Game]
     """
 
     fair_play_removals: List[str]
-    games: List[Game]
+    games: Sequence[Game]
 
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Group":
@@ -1097,7 +1199,7 @@ class Group:
             raise ValueError("Invalid input data. Expected a dictionary.")
         return cls(
             fair_play_removals=data["fair_play_removals"],
-            games=[Game.from_dict(game) for game in data["games"]],
+            games=_LazyList(data["games"], Game.from_dict),
         )
 
     def __eq__(self, other: Any) -> bool:
@@ -1115,7 +1217,7 @@ class Group:
 
 
 # TODO: We might want to rename this
-@dataclass
+@_dataclass
 class Round:
     """Represents a round in a chess tournament.
 
@@ -1130,11 +1232,15 @@ class Round:
     :type _groups: Optional[List[Group]]
     :ivar players: List of dictionaries with player information.
     :type players: List[Dict[str, str]]
+    :ivar group_ids: ``(tournament, round, group)`` tuples parsed once from
+        the group URLs at construction time.
+    :type group_ids: List[tuple]
     """
 
     group_urls: List[str]
     _groups: Optional[List[Group]] = field(default=None, init=False, repr=False)
     players: List[Dict[str, str]]
+    group_ids: "list[tuple[str, int, int]]" = field(default_factory=list)
     _seen_group_urls: set[tuple[str, int, int]] = field(default_factory=set)
 
     @classmethod
@@ -1148,7 +1254,15 @@ class Round:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(group_urls=data["groups"], players=data["players"])
+        group_ids = []
+        for url in data["groups"]:
+            parts = url.rsplit("/", 3)
+            group_ids.append((parts[1], int(parts[2]), int(parts[3])))
+        return cls(
+            group_urls=data["groups"],
+            players=data["players"],
+            group_ids=group_ids,
+        )
 
     async def fetch_groups(self, client: ChessComClient) -> "List[Group]":
         """Fetch groups from the Chess.com API client.
@@ -1166,32 +1280,42 @@ class Round:
         self._groups = self._groups or []
         self._seen_group_urls = self._seen_group_urls or set()
 
-        async def fetch_group(group_url: str) -> Optional["Group"]:
-            parts = group_url.split("/")[-3:]
-            group_id = (parts[0], int(parts[1]), int(parts[2]))
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+        async def fetch_group(group_id: "tuple[str, int, int]") -> Optional["Group"]:
             if group_id in self._seen_group_urls:
                 return None
-            try:
-                group = await client.get_tournament_round_group(*group_id)
-                self._seen_group_urls.add(group_id)
-                return group
-            except RateLimitError:
-                print(f"Rate limit hit for group {group_id}. Retrying...")
-                await asyncio.sleep(2)
-                return await fetch_group(group_url)
-            except Exception as e:
-                print(f"Error fetching group {group_id}: {e}")
-                return None
-
-        tasks = [fetch_group(url) for url in self.group_urls]
-        fetched_groups = await asyncio.gather(*tasks, return_exceptions=True)
-
-        if not isinstance(fetched_groups, list):
-            raise ValueError("Invalid input data. Expected a list.")
-        valid_groups: Iterable[Group] = (
-            g for g in fetched_groups if isinstance(g, Group)
-        )
-        self._groups.extend(valid_groups)
+            for attempt in range(_FETCH_MAX_RETRIES):
+                try:
+                    async with semaphore:
+                        group = await client.get_tournament_round_group(*group_id)
+                    self._seen_group_urls.add(group_id)
+                    return group
+                except RateLimitError:
+                    delay = _FETCH_BACKOFF_BASE * 2**attempt + random.uniform(0, 1)
+                    logger.debug(
+                        "Rate limit hit for group %s. Retrying in %.1fs...",
+                        group_id,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    logger.debug("Error fetching group %s: %s", group_id, e)
+                    return None
+            return None
+
+        # Ids are parsed once in from_dict; fall back for hand-built rounds.
+        group_ids = self.group_ids
+        if not group_ids:
+            for url in self.group_urls:
+                parts = url.rsplit("/", 3)
+                group_ids.append((parts[1], int(parts[2]), int(parts[3])))
+        # Stream results as they finish instead of buffering the whole batch.
+        coros = [fetch_group(group_id) for group_id in group_ids]
+        for completed in asyncio.as_completed(coros):
+            group = await completed
+            if group is not None:
+                self._groups.append(group)
 
         return self._groups
 
@@ -1229,7 +1353,7 @@ class Round:
         )
 
 
-@dataclass
+@_dataclass
 class Tournament:
     """Represent a chess tournament with its various attributes and methods.
 
@@ -1258,6 +1382,9 @@ class Tournament:
     :type players: List[Dict]
     :ivar round_urls: URLs for each round of the tournament.
     :type round_urls: List[str]
+    :ivar round_ids: ``(tournament, round)`` tuples parsed once from the
+        round URLs at construction time.
+    :type round_ids: List[tuple]
     :ivar _rounds: List of fetched rounds, initially set to None.
     :type _rounds: Optional[List[Round]]
     """
@@ -1271,7 +1398,11 @@ class Tournament:
     settings: Dict[str, Any]
     players: List[Dict[str, str]]
     round_urls: List[str]
+    round_ids: "list[tuple[str, int]]" = field(default_factory=list)
     _rounds: List[Round] = field(default_factory=list, init=False, repr=False)
+    _seen_round_ids: "set[tuple[str, int]]" = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Tournament":
@@ -1299,6 +1430,10 @@ class Tournament:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
+        round_ids = []
+        for url in data["rounds"]:
+            head, _, round_num = url.rpartition("/")
+            round_ids.append((head.rpartition("/")[2], int(round_num)))
         return cls(
             name=data["name"],
             url=data["url"],
@@ -1309,6 +1444,7 @@ class Tournament:
             settings=data["settings"],
             players=data["players"],
             round_urls=data["rounds"],
+            round_ids=round_ids,
         )
 
     async def fetch_rounds(self, client: ChessComClient) -> "List[Round]":
@@ -1322,30 +1458,47 @@ class Tournament:
         :return: A list of fetched rounds.
         :rtype: List[Round]
         """
-        seen_rounds = set(self._rounds)
+        # Dedup by the parsed id tuple: the old set of Round objects could
+        # never match the tuples it was probed with, so every call re-fetched
+        # all rounds.
+        seen_round_ids = self._seen_round_ids
 
-        async def fetch_round(round_url: str) -> Optional[Round]:
-            round_id = (round_url.split("/")[-2], int(round_url.split("/")[-1]))
-            if round_id in seen_rounds:
-                return None
-            try:
-                round_obj = await client.get_tournament_round(*round_id)
-                seen_rounds.add(round_obj)
-                return round_obj
-            except RateLimitError:
-                print(f"Rate limit hit for round {round_id}. Retrying...")
-                await asyncio.sleep(2)
-                return await fetch_round(round_url)
-            except Exception as e:
-                print(f"Error fetching round {round_id}: {e}")
-                return None
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
 
-        tasks = [fetch_round(url) for url in self.round_urls]
-        fetched_rounds = await asyncio.gather(*tasks, return_exceptions=True)
-        filtered_rounds: List[Optional[Round]] = [
-            r if isinstance(r, Round) else None for r in fetched_rounds
-        ]
-        self._rounds.extend(filter(None, filtered_rounds))
+        async def fetch_round(round_id: "tuple[str, int]") -> Optional[Round]:
+            if round_id in seen_round_ids:
+                return None
+            for attempt in range(_FETCH_MAX_RETRIES):
+                try:
+                    async with semaphore:
+                        round_obj = await client.get_tournament_round(*round_id)
+                    seen_round_ids.add(round_id)
+                    return round_obj
+                except RateLimitError:
+                    delay = _FETCH_BACKOFF_BASE * 2**attempt + random.uniform(0, 1)
+                    logger.debug(
+                        "Rate limit hit for round %s. Retrying in %.1fs...",
+                        round_id,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    logger.debug("Error fetching round %s: %s", round_id, e)
+                    return None
+            return None
+
+        # Ids are parsed once in from_dict; fall back for hand-built objects.
+        round_ids = self.round_ids
+        if not round_ids:
+            for url in self.round_urls:
+                head, _, round_num = url.rpartition("/")
+                round_ids.append((head.rpartition("/")[2], int(round_num)))
+        # Stream results as they finish instead of buffering the whole batch.
+        coros = [fetch_round(round_id) for round_id in round_ids]
+        for completed in asyncio.as_completed(coros):
+            round_obj = await completed
+            if round_obj is not None:
+                self._rounds.append(round_obj)
         return self._rounds
 
     @property
@@ -1370,7 +1523,7 @@ class Tournament:
         return self._rounds
 
 
-@dataclass
+@_dataclass
 class BoardGame(Game):
     """Represents a board game derived from the base Game class.
 
@@ -1379,59 +1532,14 @@ class BoardGame(Game):
     of corresponding player types. A board game can be created from a dictionary using
     the `from_dict` class method.
 
-    :ivar white: Instance of White player.
-    :type white: Optional[White]
-    :ivar black: Instance of Black player.
-    :type black: Optional[Black]
+    :ivar white: The white side of the game.
+    :type white: Optional[GamePlayer]
+    :ivar black: The black side of the game.
+    :type black: Optional[GamePlayer]
     """
 
-    white: Optional[White] = field(default=None, init=False)  # type: ignore
-    black: Optional[Black] = field(default=None, init=False)  # type: ignore
-
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "BoardGame":
-        """Create a BoardGame instance from a dictionary.
-
-        The method instantiates a BoardGame object based on the data
-        provided in the dictionary. It initializes the key attributes
-        and sets the computed fields for white and black pieces.
-
-        :param data: A dictionary containing details of the board game.
-        :type data: Dict
-
-        :return: An instance of BoardGame created from dictionary data.
-        :rtype: BoardGame
-        """
-        # Create the base instance
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        instance = cls(
-            white_url=data["white"]["@id"],  # Parent field
-            black_url=data["black"]["@id"],  # Parent field
-            url=data["url"],
-            fen=data["fen"],
-            time_control=data["time_control"],
-            time_class=data["time_class"],
-            rules=data["rules"],
-            rated=data.get("rated", False),
-            accuracies=data.get("accuracies"),
-            tournament=data.get("tournament"),
-            match=data.get("match"),
-            eco=data.get("eco"),
-            start_time=data.get("start_time"),
-            end_time=data.get("end_time"),
-            id=int(data["url"].split("/")[-1]),
-            pgn=data.get("pgn"),
-            tcn=data.get("tcn"),
-            initial_setup=data.get("initial_setup"),
-            uuid=data.get("uuid"),
-        )
-
-        # Set computed fields
-        instance.white = White.from_dict(data["white"])
-        instance.black = Black.from_dict(data["black"])
-
-        return instance
+    white: Optional[GamePlayer] = field(default=None, init=False)  # type: ignore
+    black: Optional[GamePlayer] = field(default=None, init=False)  # type: ignore
 
     def __eq__(self, other: Any) -> bool:
         """Check equality based on game attributes."""
@@ -1464,7 +1572,7 @@ class BoardGame(Game):
         )
 
 
-@dataclass
+@_dataclass
 class Board:
     """Represents a collection of board games and their associated scores.
 
@@ -1474,12 +1582,12 @@ class Board:
 
     :ivar board_scores: A dictionary mapping board game names to their scores.
     :type board_scores: Dict
-    :ivar games: A list of BoardGame objects representing different board games.
-    :type games: List[BoardGame]
+    :ivar games: BoardGame objects for the board, parsed lazily on access.
+    :type games: Sequence[BoardGame]
     """
 
     board_scores: Dict[str, int]
-    games: List[BoardGame]
+    games: Sequence[BoardGame]
 
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Board":
@@ -1495,16 +1603,18 @@ class Board:
             raise ValueError("Invalid input data. Expected a dictionary.")
         return cls(
             board_scores=data["board_scores"],
-            games=[BoardGame.from_dict(board_game) for board_game in data["games"]],
+            games=_LazyList(data["games"], BoardGame.from_dict),
         )
 
 
-@dataclass
-class MatchResult:
+class MatchResult(NamedTuple):
     """Representation of match results data for a game.
 
     This class stores data about the players who played as white and black in a
-    match. It provides a class method to instantiate objects from a dictionary.
+    match. It is a named tuple rather than a dataclass: instances are built in
+    tight loops inside the generated match constructors, and tuple
+    construction via ``_make`` skips the per-field attribute assignment a
+    generated ``__init__`` would perform.
 
     :ivar played_as_white: Name of the player who played as white.
     :type played_as_white: Optional[str]
@@ -1529,13 +1639,12 @@ class MatchResult:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            played_as_white=data.get("played_as_white", None),
-            played_as_black=data.get("played_as_black", None),
+        return cls._make(
+            (data.get("played_as_white"), data.get("played_as_black"))
         )
 
 
-@dataclass
+@_dataclass
 class FinishedPlayerMatch:
     """Represents a player's finished match in a chess club context.
 
@@ -1569,32 +1678,9 @@ class FinishedPlayerMatch:
     results: MatchResult
     board_url: str
     _board: Optional[Board] = field(default=None, init=False, repr=False)
-
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "FinishedPlayerMatch":
-        """Create a FinishedPlayerMatch instance from a dictionary.
-
-        This class method takes a dictionary representing a finished player match and
-        converts it into an instance of FinishedPlayerMatch with all required
-        attributes.
-
-        :param data: The dictionary containing finished player match details.
-        :type data: Dict
-        :return: A FinishedPlayerMatch instance created from the provided dictionary.
-        :rtype: FinishedPlayerMatch
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            name=data["name"],
-            url=data["url"],
-            id=data["@id"],
-            club_url=data["club"],
-            results=MatchResult.from_dict(data["results"]),
-            board_url=data["board"],
-        )
+    _board_id: "Optional[tuple[int, int]]" = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     async def fetch_club(self, client: ChessComClient) -> "Club":
         """Fetch club details asynchronously using the provided client instance.
@@ -1609,7 +1695,7 @@ class FinishedPlayerMatch:
         :rtype: Club
         """
         if self._club is None:
-            self._club = await client.get_club(url_id=self.club_url.split("/")[-1])
+            self._club = await client.get_club(url_id=self.club_url.rpartition("/")[2])
         return self._club
 
     @property
@@ -1642,10 +1728,10 @@ class FinishedPlayerMatch:
         :rtype: Board
         """
         if self._board is None:
-            self._board = await client.get_match_board(
-                match_id=int(self.board_url.split("/")[-2]),
-                board_num=int(self.board_url.split("/")[-1]),
-            )
+            if self._board_id is None:
+                match_id, board_num = self.board_url.rsplit("/", 2)[-2:]
+                self._board_id = (int(match_id), int(board_num))
+            self._board = await client.get_match_board(*self._board_id)
         return self._board
 
     @property
@@ -1665,7 +1751,7 @@ class FinishedPlayerMatch:
         return self._board
 
 
-@dataclass
+@_dataclass
 class InProgressPlayerMatch:
     """Representation of an in-progress player match in a chess competition.
 
@@ -1698,37 +1784,9 @@ class InProgressPlayerMatch:
     results: MatchResult
     board_url: str
     _board: Optional[Board] = field(default=None, init=False, repr=False)
-
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "InProgressPlayerMatch":
-        """Create an instance of InProgressPlayerMatch from a dictionary.
-
-        This method constructs an object of InProgressPlayerMatch using the
-        key-value pairs from the provided dictionary.
-
-        :param data: Dictionary containing the data required to create
-            an instance of InProgressPlayerMatch.
-            - name: The name of the player (str).
-            - url: The URL associated with the player (str).
-            - @id: The ID of the player (str).
-            - club: The URL of the player's club (str).
-            - results: The match results which are passed to
-              `MatchResult.from_dict` method.
-            - board: The URL of the player's board (str).
-        :return: An instance of InProgressPlayerMatch.
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            name=data["name"],
-            url=data["url"],
-            id=data["@id"],
-            club_url=data["club"],
-            results=MatchResult.from_dict(data["results"]),
-            board_url=data["board"],
-        )
+    _board_id: "Optional[tuple[int, int]]" = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     async def fetch_club(self, client: ChessComClient) -> "Club":
         """Fetch club information from ChessComClient.
@@ -1743,7 +1801,7 @@ class InProgressPlayerMatch:
         :rtype: Club
         """
         if self._club is None:
-            self._club = await client.get_club(url_id=self.club_url.split("/")[-1])
+            self._club = await client.get_club(url_id=self.club_url.rpartition("/")[2])
         return self._club
 
     @property
@@ -1778,10 +1836,10 @@ class InProgressPlayerMatch:
         :rtype: Board
         """
         if self._board is None:
-            self._board = await client.get_match_board(
-                match_id=int(self.board_url.split("/")[-2]),
-                board_num=int(self.board_url.split("/")[-1]),
-            )
+            if self._board_id is None:
+                match_id, board_num = self.board_url.rsplit("/", 2)[-2:]
+                self._board_id = (int(match_id), int(board_num))
+            self._board = await client.get_match_board(*self._board_id)
         return self._board
 
     @property
@@ -1804,7 +1862,7 @@ class InProgressPlayerMatch:
         return self._board
 
 
-@dataclass
+@_dataclass
 class RegisteredPlayerMatch:
     """Class representing a registered player's match in a chess competition.
 
@@ -1832,27 +1890,9 @@ class RegisteredPlayerMatch:
     _club: Optional[Club] = field(default=None, init=False, repr=False)
     match_url: str
     _match: Optional[Match] = field(default=None, init=False, repr=False)
-
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "RegisteredPlayerMatch":
-        """Create a RegisteredPlayerMatch instance from a dictionary.
-
-        :param data: Dictionary containing the data to
-         create a RegisteredPlayerMatch instance.
-        :type data: dict
-        :return: A new instance of RegisteredPlayerMatch.
-        :rtype: RegisteredPlayerMatch
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            name=data["name"],
-            url=data["url"],
-            club_url=data["club"],
-            match_url=data["@id"],
-        )
+    _match_id: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     async def fetch_club(self, client: ChessComClient) -> "Club":
         """Fetch the club details from the Chess.com client.
@@ -1868,7 +1908,7 @@ class RegisteredPlayerMatch:
         :rtype: Club
         """
         if self._club is None:
-            self._club = await client.get_club(url_id=self.club_url.split("/")[-1])
+            self._club = await client.get_club(url_id=self.club_url.rpartition("/")[2])
         return self._club
 
     @property
@@ -1902,9 +1942,9 @@ class RegisteredPlayerMatch:
         :rtype: Match
         """
         if self._match is None:
-            self._match = await client.get_match(
-                match_id=int(self.match_url.split("/")[-1])
-            )
+            if self._match_id is None:
+                self._match_id = int(self.match_url.rpartition("/")[2])
+            self._match = await client.get_match(match_id=self._match_id)
         return self._match
 
     @property
@@ -1928,7 +1968,7 @@ class RegisteredPlayerMatch:
         return self._match
 
 
-@dataclass
+@_dataclass
 class PlayerMatches:
     """Represents a collection of player matches.
 
@@ -1936,17 +1976,17 @@ class PlayerMatches:
     progress with, and is registered for. It provides methods to create instances
     of itself from a dictionary, supporting easy data deserialization.
 
-    :ivar finished: List of finished player matches.
-    :type finished: List[FinishedPlayerMatch]
-    :ivar in_progress: List of player matches that are currently in progress.
-    :type in_progress: List[InProgressPlayerMatch]
-    :ivar registered: List of player matches that the player is registered for.
-    :type registered: List[RegisteredPlayerMatch]
+    :ivar finished: Finished player matches, parsed lazily on access.
+    :type finished: Sequence[FinishedPlayerMatch]
+    :ivar in_progress: Player matches that are currently in progress.
+    :type in_progress: Sequence[InProgressPlayerMatch]
+    :ivar registered: Player matches that the player is registered for.
+    :type registered: Sequence[RegisteredPlayerMatch]
     """
 
-    finished: List[FinishedPlayerMatch]
-    in_progress: List[InProgressPlayerMatch]
-    registered: List[RegisteredPlayerMatch]
+    finished: Sequence[FinishedPlayerMatch]
+    in_progress: Sequence[InProgressPlayerMatch]
+    registered: Sequence[RegisteredPlayerMatch]
 
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "PlayerMatches":
@@ -1963,22 +2003,13 @@ class PlayerMatches:
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
         return cls(
-            finished=[
-                FinishedPlayerMatch.from_dict(finished_player_match)
-                for finished_player_match in data["finished"]
-            ],
-            in_progress=[
-                InProgressPlayerMatch.from_dict(in_progress_player_match)
-                for in_progress_player_match in data["in_progress"]
-            ],
-            registered=[
-                RegisteredPlayerMatch.from_dict(registered_player_match)
-                for registered_player_match in data["registered"]
-            ],
+            finished=_LazyList(data["finished"], FinishedPlayerMatch.from_dict),
+            in_progress=_LazyList(data["in_progress"], InProgressPlayerMatch.from_dict),
+            registered=_LazyList(data["registered"], RegisteredPlayerMatch.from_dict),
         )
 
 
-@dataclass
+@_dataclass
 class FinishedPlayerTournament:
     """Represents a player’s performance in a completed chess tournament.
 
@@ -2017,31 +2048,6 @@ class FinishedPlayerTournament:
     status: str
     total_players: int
 
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "FinishedPlayerTournament":
-        """Construct a FinishedPlayerTournament instance from a dictionary.
-
-        :param data: Dictionary containing tournament details.
-        :type data: Dict
-        :return: Instantiated FinishedPlayerTournament object.
-        :rtype: FinishedPlayerTournament
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            url=data["url"],
-            tournament_url=data["@id"],
-            wins=data["wins"],
-            losses=data["losses"],
-            draws=data["draws"],
-            points_awarded=data.get("points_awarded", 0),
-            placement=data["placement"],
-            status=data["status"],
-            total_players=data["total_players"],
-        )
-
     async def fetch_tournament(self, client: ChessComClient) -> "Tournament":
         """Fetch the tournament details using the provided ChessComClient instance.
 
@@ -2055,7 +2061,7 @@ class FinishedPlayerTournament:
         """
         if self._tournament is None:
             self._tournament = await client.get_tournament(
-                url_id=self.tournament_url.split("/")[-1]
+                url_id=self.tournament_url.rpartition("/")[2]
             )
         return self._tournament
 
@@ -2074,7 +2080,7 @@ class FinishedPlayerTournament:
         return self._tournament
 
 
-@dataclass
+@_dataclass
 class InProgressPlayerTournament:
     """Represent an in-progress player tournament.
 
@@ -2109,29 +2115,6 @@ class InProgressPlayerTournament:
     status: str
     total_players: int
 
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "InProgressPlayerTournament":
-        """Convert a dictionary to an InProgressPlayerTournament instance.
-
-        :param data: The dictionary containing tournament details.
-        :type data: Dict
-        :return: An instance of InProgressPlayerTournament based on the dictionary data.
-        :rtype: InProgressPlayerTournament
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            url=data["url"],
-            tournament_url=data["@id"],
-            wins=data["wins"],
-            losses=data["losses"],
-            draws=data["draws"],
-            status=data["status"],
-            total_players=data["total_players"],
-        )
-
     async def fetch_tournament(self, client: ChessComClient) -> "Tournament":
         """Fetch the tournament details from the ChessComClient.
 
@@ -2145,7 +2128,7 @@ class InProgressPlayerTournament:
         """
         if self._tournament is None:
             self._tournament = await client.get_tournament(
-                url_id=self.tournament_url.split("/")[-1]
+                url_id=self.tournament_url.rpartition("/")[2]
             )
         return self._tournament
 
@@ -2171,7 +2154,7 @@ class InProgressPlayerTournament:
         return self._tournament
 
 
-@dataclass
+@_dataclass
 class RegisteredPlayerTournament:
     """Represents a registered player's tournament details.
 
@@ -2194,25 +2177,6 @@ class RegisteredPlayerTournament:
     _tournament: Optional[Tournament] = field(default=None, init=False, repr=False)
     status: str
 
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "RegisteredPlayerTournament":
-        """Convert a dictionary to a RegisteredPlayerTournament object.
-
-        This class method takes a dictionary containing the keys 'url', '@id',
-        and 'status', and creates an instance of the RegisteredPlayerTournament class
-        using these values.
-
-        :param data: Dictionary containing tournament registration details.
-        :type data: Dict
-        :return: RegisteredPlayerTournament object instantiated with the provided data.
-        :rtype: RegisteredPlayerTournament
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(url=data["url"], tournament_url=data["@id"], status=data["status"])
-
     async def fetch_tournament(self, client: ChessComClient) -> "Tournament":
         """Retrieve tournament details asynchronously from the Chess.com API.
 
@@ -2226,7 +2190,7 @@ class RegisteredPlayerTournament:
         """
         if self._tournament is None:
             self._tournament = await client.get_tournament(
-                url_id=self.tournament_url.split("/")[-1]
+                url_id=self.tournament_url.rpartition("/")[2]
             )
         return self._tournament
 
@@ -2246,7 +2210,7 @@ class RegisteredPlayerTournament:
         return self._tournament
 
 
-@dataclass
+@_dataclass
 class PlayerTournaments:
     """Representation of a player's participation in tournaments.
 
@@ -2255,16 +2219,16 @@ class PlayerTournaments:
     tournament history and current involvement.
 
     :ivar finished: Tournaments that the player has completed.
-    :type finished: List[FinishedPlayerTournament]
+    :type finished: Sequence[FinishedPlayerTournament]
     :ivar in_progress: Tournaments that the player is currently participating in.
-    :type in_progress: List[InProgressPlayerTournament]
+    :type in_progress: Sequence[InProgressPlayerTournament]
     :ivar registered: Tournaments that the player is registered for but has not started.
-    :type registered: List[RegisteredPlayerTournament]
+    :type registered: Sequence[RegisteredPlayerTournament]
     """
 
-    finished: List[FinishedPlayerTournament]
-    in_progress: List[InProgressPlayerTournament]
-    registered: List[RegisteredPlayerTournament]
+    finished: Sequence[FinishedPlayerTournament]
+    in_progress: Sequence[InProgressPlayerTournament]
+    registered: Sequence[RegisteredPlayerTournament]
 
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "PlayerTournaments":
@@ -2278,22 +2242,17 @@ class PlayerTournaments:
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
         return cls(
-            finished=[
-                FinishedPlayerTournament.from_dict(finished_player_tournament)
-                for finished_player_tournament in data["finished"]
-            ],
-            in_progress=[
-                InProgressPlayerTournament.from_dict(in_progress_player_tournament)
-                for in_progress_player_tournament in data["in_progress"]
-            ],
-            registered=[
-                RegisteredPlayerTournament.from_dict(registered_player_tournament)
-                for registered_player_tournament in data["registered"]
-            ],
+            finished=_LazyList(data["finished"], FinishedPlayerTournament.from_dict),
+            in_progress=_LazyList(
+                data["in_progress"], InProgressPlayerTournament.from_dict
+            ),
+            registered=_LazyList(
+                data["registered"], RegisteredPlayerTournament.from_dict
+            ),
         )
 
 
-@dataclass
+@_dataclass
 class FinishedClubMatch:
     """Represents a finished chess club match.
 
@@ -2325,35 +2284,16 @@ class FinishedClubMatch:
     _match: Optional[Match] = field(default=None, init=False, repr=False)
     opponent_url: str
     _opponent: Optional[Club] = field(default=None, init=False, repr=False)
+    _match_id: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _opponent_id: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     start_time: int
     time_class: str
     result: str
 
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "FinishedClubMatch":
-        """Create an instance of FinishedClubMatch from a dictionary.
-
-        This method constructs an instance of the FinishedClubMatch class using
-        the provided dictionary containing relevant match data. The data dictionary
-        should include keys corresponding to the attributes of the FinishedClubMatch
-        class.
-
-        :param data: Dictionary containing match data.
-        :type data: Dict
-        :return: An instance of the FinishedClubMatch class.
-        :rtype: FinishedClubMatch
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            name=data["name"],
-            match_url=data["@id"],
-            opponent_url=data["opponent"],
-            start_time=data["start_time"],
-            time_class=data["time_class"],
-            result=data["result"],
-        )
-
     async def fetch_match(self, client: ChessComClient) -> "Match":
         """Fetch and cache a chess match using the given Chess.com client.
 
@@ -2367,9 +2307,9 @@ class FinishedClubMatch:
         :rtype: Match
         """
         if self._match is None:
-            self._match = await client.get_match(
-                match_id=int(self.match_url.split("/")[-1])
-            )
+            if self._match_id is None:
+                self._match_id = int(self.match_url.rpartition("/")[2])
+            self._match = await client.get_match(match_id=self._match_id)
         return self._match
 
     @property
@@ -2405,9 +2345,9 @@ class FinishedClubMatch:
         :rtype: Club
         """
         if self._opponent is None:
-            self._opponent = await client.get_club(
-                url_id=self.opponent_url.split("/")[-1]
-            )
+            if self._opponent_id is None:
+                self._opponent_id = self.opponent_url.rpartition("/")[2]
+            self._opponent = await client.get_club(url_id=self._opponent_id)
         return self._opponent
 
     @property
@@ -2428,7 +2368,7 @@ class FinishedClubMatch:
         return self._opponent
 
 
-@dataclass
+@_dataclass
 class InProgressClubMatch:
     """Representation of an in-progress club match.
 
@@ -2457,30 +2397,15 @@ class InProgressClubMatch:
     _match: Optional[Match] = field(default=None, init=False, repr=False)
     opponent_url: str
     _opponent: Optional[Club] = field(default=None, init=False, repr=False)
+    _match_id: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _opponent_id: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     start_time: int
     time_class: str
 
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "InProgressClubMatch":
-        """Create an instance of InProgressClubMatch from a dictionary.
-
-        :param data: Dictionary containing match details.
-        :type data: Dict
-        :return: Instance of InProgressClubMatch.
-        :rtype: InProgressClubMatch
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            name=data["name"],
-            match_url=data["@id"],
-            opponent_url=data["opponent"],
-            start_time=data["start_time"],
-            time_class=data["time_class"],
-        )
-
     async def fetch_match(self, client: ChessComClient) -> "Match":
         """Fetch match information from Chess.com.
 
@@ -2493,9 +2418,9 @@ class InProgressClubMatch:
         :rtype: Match
         """
         if self._match is None:
-            self._match = await client.get_match(
-                match_id=int(self.match_url.split("/")[-1])
-            )
+            if self._match_id is None:
+                self._match_id = int(self.match_url.rpartition("/")[2])
+            self._match = await client.get_match(match_id=self._match_id)
         return self._match
 
     @property
@@ -2526,9 +2451,9 @@ class InProgressClubMatch:
         :rtype: Club
         """
         if self._opponent is None:
-            self._opponent = await client.get_club(
-                url_id=self.opponent_url.split("/")[-1]
-            )
+            if self._opponent_id is None:
+                self._opponent_id = self.opponent_url.rpartition("/")[2]
+            self._opponent = await client.get_club(url_id=self._opponent_id)
         return self._opponent
 
     @property
@@ -2550,7 +2475,7 @@ class InProgressClubMatch:
         return self._opponent
 
 
-@dataclass
+@_dataclass
 class RegisteredClubMatch:
     """Represent a registered club match.
 
@@ -2577,29 +2502,14 @@ class RegisteredClubMatch:
     _match: Optional[Match] = field(default=None, init=False, repr=False)
     opponent_url: str
     _opponent: Optional[Club] = field(default=None, init=False, repr=False)
+    _match_id: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _opponent_id: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     time_class: str
 
-    @classmethod
-    def from_dict(
-        cls, data: Union[Dict[str, Any], bytes, None]
-    ) -> "RegisteredClubMatch":
-        """Create an instance of RegisteredClubMatch from a dictionary.
-
-        :param data: Dictionary containing match information. Expected keys are
-                     'name', '@id', 'opponent', and 'time_class'.
-        :type data: Dict
-        :return: Instance of RegisteredClubMatch.
-        :rtype: RegisteredClubMatch
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            name=data["name"],
-            match_url=data["@id"],
-            opponent_url=data["opponent"],
-            time_class=data["time_class"],
-        )
-
     async def fetch_match(self, client: ChessComClient) -> "Match":
         """Fetch match information from the Chess.com API.
 
@@ -2614,9 +2524,9 @@ class RegisteredClubMatch:
         :rtype: Match
         """
         if self._match is None:
-            self._match = await client.get_match(
-                match_id=int(self.match_url.split("/")[-1])
-            )
+            if self._match_id is None:
+                self._match_id = int(self.match_url.rpartition("/")[2])
+            self._match = await client.get_match(match_id=self._match_id)
         return self._match
 
     @property
@@ -2652,9 +2562,9 @@ class RegisteredClubMatch:
         :rtype: Club
         """
         if self._opponent is None:
-            self._opponent = await client.get_club(
-                url_id=self.opponent_url.split("/")[-1]
-            )
+            if self._opponent_id is None:
+                self._opponent_id = self.opponent_url.rpartition("/")[2]
+            self._opponent = await client.get_club(url_id=self._opponent_id)
         return self._opponent
 
     @property
@@ -2675,7 +2585,7 @@ class RegisteredClubMatch:
         return self._opponent
 
 
-@dataclass
+@_dataclass
 class ClubMatches:
     """Represents a collection of club matches.
 
@@ -2695,6 +2605,14 @@ class ClubMatches:
     in_progress: List[InProgressClubMatch]
     registered: List[RegisteredClubMatch]
 
+    # Payload keys paired with their row parsers, in constructor order.
+    # Plain assignment (no annotation) keeps this off the dataclass fields.
+    _LISTS = (
+        ("finished", FinishedClubMatch),
+        ("in_progress", InProgressClubMatch),
+        ("registered", RegisteredClubMatch),
+    )
+
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "ClubMatches":
         """Create a `ClubMatches` instance from a dictionary.
@@ -2707,23 +2625,98 @@ class ClubMatches:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            finished=[
-                FinishedClubMatch.from_dict(finished_club_match)
-                for finished_club_match in data["finished"]
-            ],
-            in_progress=[
-                InProgressClubMatch.from_dict(in_progress_club_match)
-                for in_progress_club_match in data["in_progress"]
-            ],
-            registered=[
-                RegisteredClubMatch.from_dict(registered_club_match)
-                for registered_club_match in data["registered"]
+        return cls(*[match_cls.from_list(data[key]) for key, match_cls in cls._LISTS])
+
+    async def fetch_all_opponents(
+        self, client: ChessComClient, concurrency: int = _FETCH_CONCURRENCY
+    ) -> None:
+        """Fetch the opponent club for every match in all three lists at once.
+
+        Awaiting ``fetch_opponent`` per match serializes one HTTP round trip per
+        entry; this helper fans the calls out concurrently under a semaphore so
+        the round trips overlap. Afterwards each match's ``opponent`` property
+        is populated.
+
+        :param client: The client used to communicate with Chess.com.
+        :type client: ChessComClient
+        :param concurrency: Maximum number of opponent requests in flight at
+            once. Default is the shared fetch concurrency bound.
+        :type concurrency: int
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(
+            match: Union[
+                FinishedClubMatch, InProgressClubMatch, RegisteredClubMatch
             ],
+        ) -> None:
+            async with semaphore:
+                await match.fetch_opponent(client)
+
+        await asyncio.gather(
+            *(
+                fetch_one(match)
+                for match in chain(self.finished, self.in_progress, self.registered)
+            )
         )
 
 
-@dataclass
+async def _fetch_one_board(
+    client: ChessComClient,
+    match_id: int,
+    board_num: int,
+    seen_board_ids: Set[int],
+    semaphore: asyncio.Semaphore,
+) -> Optional[Board]:
+    """Fetch a single match board under the shared concurrency bound.
+
+    Module-level rather than a closure inside ``fetch_boards`` so each
+    scheduled coroutine carries plain positional locals instead of closure
+    cells. Retries rate-limited requests with the server-suggested delay
+    when present, exponential backoff with jitter otherwise; any other
+    failure is logged and yields ``None``.
+
+    :param client: The client used to communicate with Chess.com.
+    :type client: ChessComClient
+    :param match_id: Identifier of the match the board belongs to.
+    :type match_id: int
+    :param board_num: Board number to fetch.
+    :type board_num: int
+    :param seen_board_ids: Board numbers already fetched; updated on success.
+    :type seen_board_ids: Set[int]
+    :param semaphore: Bounds the number of board requests in flight.
+    :type semaphore: asyncio.Semaphore
+    :return: The fetched board, or None if it could not be retrieved.
+    :rtype: Optional[Board]
+    """
+    for attempt in range(_FETCH_MAX_RETRIES):
+        try:
+            async with semaphore:
+                board = await client.get_match_board(
+                    match_id=match_id, board_num=board_num
+                )
+            seen_board_ids.add(board_num)
+            return board
+        except RateLimitError as e:
+            # Honor the server-suggested delay when present; fall back to
+            # exponential backoff with jitter otherwise.
+            if e.retry_after is not None:
+                delay = e.retry_after
+            else:
+                delay = _FETCH_BACKOFF_BASE * 2**attempt + random.uniform(0, 1)
+            logger.debug(
+                "Rate limit hit for board %s. Retrying in %.1fs...",
+                board_num,
+                delay,
+            )
+            await asyncio.sleep(delay)
+        except Exception as e:
+            logger.debug("Error fetching board %s: %s", board_num, e)
+            return None
+    return None
+
+
+@_dataclass
 class Match:
     """Represent a chess match including its details and operations.
 
@@ -2763,43 +2756,23 @@ class Match:
     end_time: Optional[int]
     status: str
     board_count: int
-    _boards: Optional[List[Union[Board, BaseException, None]]] = field(
-        default=None, init=False, repr=False
+    _boards: Optional[List[Board]] = field(
+        default=None, init=False, repr=False, compare=False
     )
     # TODO: Implement dataclass for settings
     settings: Dict[str, Any]
     # TODO: Implement dataclass for teams
     teams: Dict[str, Any]
-    _seen_board_ids: Set[int] = field(default_factory=set, init=False, repr=False)
-
-    @classmethod
-    def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Match":
-        """Create a Match instance from a dictionary.
-
-        This method extracts relevant information from a dictionary
-        and uses it to create a new Match instance.
-
-        :param data: The dictionary containing match data.
-        :type data: Dict
-        :return: A new instance of Match created from the given dictionary.
-        :rtype: Match
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(
-            match_url=data["@id"],
-            name=data["name"],
-            url=data["url"],
-            description=data.get("description"),
-            start_time=data.get("start_time"),
-            end_time=data.get("end_time"),
-            status=data["status"],
-            board_count=data["boards"],
-            settings=data["settings"],
-            teams=data["teams"],
-        )
+    _seen_board_ids: Set[int] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _match_id: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    async def fetch_boards(self, client: ChessComClient) -> "List[Board]":
+    async def fetch_boards(
+        self, client: ChessComClient, concurrency: int = _FETCH_CONCURRENCY
+    ) -> "List[Board]":
         """Fetch all boards associated with the match for the provided client.
 
         This method initializes the boards list if it's not already done,
@@ -2808,42 +2781,39 @@ class Match:
 
         :param client: The client used to communicate with Chess.com.
         :type client: ChessComClient
+        :param concurrency: Maximum number of board requests in flight at
+            once. Default is the shared fetch concurrency bound.
+        :type concurrency: int
         :return: List of boards fetched.
         :rtype: List[Board]
         """
         self._boards = self._boards or []
-        seen_board_ids = self._seen_board_ids or set()
-
-        async def fetch_board(board_num: int) -> Optional[Board]:
-            if board_num in seen_board_ids:
-                return None
-            try:
-                board = await client.get_match_board(
-                    match_id=int(self.match_url.split("/")[-1]), board_num=board_num
-                )
-                seen_board_ids.add(board_num)
-                return board
-            except RateLimitError:
-                print(f"Rate limit hit for board {board_num}. Retrying...")
-                await asyncio.sleep(2)
-                return await fetch_board(board_num)
-            except Exception as e:
-                print(f"Error fetching board {board_num}: {e}")
-                return None
-
-        tasks = [fetch_board(i) for i in range(1, self.board_count + 1)]
-        fetched_boards = await asyncio.gather(*tasks, return_exceptions=True)
-
-        self._boards.extend(
-            filter(
-                lambda x: isinstance(x, Board) and not isinstance(x, BaseException),
-                fetched_boards,
+        seen_board_ids = self._seen_board_ids
+        if self._match_id is None:
+            self._match_id = int(self.match_url.rpartition("/")[2])
+        match_id = self._match_id
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Errors are handled inside each coroutine, so the gather needs no
+        # return_exceptions=True; retaining the exceptions would pin every
+        # failed task's traceback (and its frame locals) in memory, and
+        # cancellation still propagates through the plain gather.
+        # Boards fetched on a previous call are filtered out before any
+        # coroutine is scheduled rather than checked per task.
+        fetched_boards = await asyncio.gather(
+            *(
+                _fetch_one_board(client, match_id, i, seen_board_ids, semaphore)
+                for i in range(1, self.board_count + 1)
+                if i not in seen_board_ids
             )
         )
-        return [board for board in self._boards if isinstance(board, Board)]
+
+        self._boards.extend(board for board in fetched_boards if board is not None)
+        return self._boards
 
     @property
-    def boards(self) -> "Optional[List[Union[Board, BaseException, None]]]":
+    def boards(self) -> "List[Board]":
         """Get the list of boards.
 
         Raises a ValueError if boards have not been fetched.
@@ -2852,7 +2822,7 @@ class Match:
         :return: List of boards.
         :rtype: List[Board]
         """
-        if self._boards is None or not isinstance(self._boards, list):
+        if self._boards is None:
             raise ValueError(
                 "Boards have not been fetched. Call `fetch_boards` with an API client "
                 "first."
@@ -2860,12 +2830,13 @@ class Match:
         return self._boards
 
 
-@dataclass
-class Country:
+class Country(NamedTuple):
     """Represents a country with a unique code and name.
 
     A Country object comprises a code and a name, and can be instantiated directly
-    or through a class method that parses a dictionary.
+    or through a class method that parses a dictionary. It is a ``NamedTuple``:
+    both fields are immutable strings, equality is the C-level tuple comparison,
+    and instances are hashable.
 
     :ivar code: The unique code representing the country.
                This could be a standard country code like 'US' for the United States.
@@ -2888,10 +2859,15 @@ class Country:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
-        return cls(code=data["code"], name=data["name"])
+        return _country(data["code"], data["name"])
+
 
+# Country codes form a small, fixed enumeration that recurs across thousands of
+# players, so repeated lookups share one interned instance per (code, name) pair.
+_country = lru_cache(maxsize=None)(Country)
 
-@dataclass
+
+@_dataclass
 class DailyPuzzle:
     """Represents a daily chess puzzle.
 
@@ -2941,7 +2917,7 @@ class DailyPuzzle:
         )
 
 
-@dataclass
+@_dataclass
 class Streamer:
     """Represents a streamer with attributes related to their streaming platforms.
 
@@ -2993,6 +2969,15 @@ class Streamer:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
+        defaults = _PLATFORM_DEFAULTS
+        platforms = [
+            {key: platform.get(key, default) for key, default in defaults}
+            for platform in data.get("platforms", ())
+        ]
+        for platform in platforms:
+            # Platform types are a tiny enumeration ("twitch", "youtube", ...)
+            # repeated across every streamer; interning shares one string.
+            platform["type"] = sys.intern(platform["type"])
         return cls(
             username=data["username"],
             avatar=data.get("avatar", ""),
@@ -3000,22 +2985,11 @@ class Streamer:
             url=data["url"],
             is_live=data.get("is_live", False),
             is_community_streamer=data.get("is_community_streamer", False),
-            platforms=[
-                {
-                    "type": platform.get("type", ""),
-                    "stream_url": platform.get("stream_url", ""),
-                    "channel_url": platform.get("channel_url", ""),
-                    "is_live": platform.get("is_live", False),
-                    "is_main_live_platform": platform.get(
-                        "is_main_live_platform", False
-                    ),
-                }
-                for platform in data.get("platforms", [])  # Iterate through `platforms`
-            ],
+            platforms=platforms,
         )
 
 
-@dataclass
+@_dataclass
 class LeaderboardEntry:
     """Representation of a leaderboard entry.
 
@@ -3055,14 +3029,16 @@ class LeaderboardEntry:
             raise ValueError("Invalid input data. Expected a dictionary.")
         return cls(
             player_id=data["player_id"],
-            username=data["username"],
+            # The same player recurs across the 12 leaderboard categories;
+            # interning lets those rows share one username string.
+            username=sys.intern(data["username"]),
             score=data["score"],
             rank=data["rank"],
             url=data["url"],
         )
 
 
-@dataclass
+@_dataclass
 class Leaderboard:
     """Representation of a leaderboard for various game categories.
 
@@ -3111,12 +3087,30 @@ class Leaderboard:
     lessons: List[LeaderboardEntry]
     tactics: List[LeaderboardEntry]
 
+    # Category keys in field order; from_dict builds the constructor
+    # arguments positionally from this tuple.
+    _CATEGORIES = (
+        "daily",
+        "daily960",
+        "live_rapid",
+        "live_blitz",
+        "live_bullet",
+        "live_bughouse",
+        "live_blitz960",
+        "live_threecheck",
+        "live_crazyhouse",
+        "live_kingofthehill",
+        "lessons",
+        "tactics",
+    )
+
     @classmethod
     def from_dict(cls, data: Union[Dict[str, Any], bytes, None]) -> "Leaderboard":
         """Create a Leaderboard instance from a dictionary.
 
-        This class method parses a dictionary to create an instance of the Leaderboard
-        class, mapping various leaderboard categories to their corresponding entries.
+        The categories are parsed in one pass over the class-level
+        ``_CATEGORIES`` tuple, with the entry constructor bound to a local so
+        the hot comprehension avoids repeated global lookups.
 
         :param data: Dictionary containing leaderboard data.
         :type data: Dict
@@ -3125,49 +3119,277 @@ class Leaderboard:
         """
         if not isinstance(data, dict):
             raise ValueError("Invalid input data. Expected a dictionary.")
+        fd = LeaderboardEntry.from_dict
         return cls(
-            daily=[
-                LeaderboardEntry.from_dict(entry) for entry in data.get("daily", [])
-            ],
-            daily960=[
-                LeaderboardEntry.from_dict(entry) for entry in data.get("daily960", [])
-            ],
-            live_rapid=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_rapid", [])
-            ],
-            live_blitz=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_blitz", [])
-            ],
-            live_bullet=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_bullet", [])
-            ],
-            live_bughouse=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_bughouse", [])
-            ],
-            live_blitz960=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_blitz960", [])
-            ],
-            live_threecheck=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_threecheck", [])
-            ],
-            live_crazyhouse=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_crazyhouse", [])
-            ],
-            live_kingofthehill=[
-                LeaderboardEntry.from_dict(entry)
-                for entry in data.get("live_kingofthehill", [])
-            ],
-            lessons=[
-                LeaderboardEntry.from_dict(entry) for entry in data.get("lessons", [])
-            ],
-            tactics=[
-                LeaderboardEntry.from_dict(entry) for entry in data.get("tactics", [])
-            ],
+            *[
+                [fd(entry) for entry in data.get(key, ())]
+                for key in cls._CATEGORIES
+            ]
         )
+
+
+# Generated constructors. Each spec pairs a constructor keyword with the
+# expression that pulls it out of the payload; ``_ft`` is the hoisted alias
+# for ``datetime.fromtimestamp`` available inside the generated functions.
+_compile_from_dict(
+    TimeControlStats,
+    [
+        ("last_rating", "_last.get('rating')"),
+        ("last_date_ts", "_last.get('date')"),
+        ("last_rd", "_last.get('rd')"),
+        ("best_rating", "_best.get('rating')"),
+        ("best_date_ts", "_best.get('date')"),
+        ("best_game", "_best.get('game')"),
+        ("record_win", "_record.get('win', 0)"),
+        ("record_loss", "_record.get('loss', 0)"),
+        ("record_draw", "_record.get('draw', 0)"),
+    ],
+    pre=[
+        "_last = data.get('last') or {}",
+        "_best = data.get('best') or {}",
+        "_record = data.get('record') or {}",
+    ],
+)
+_compile_from_dict(
+    Player,
+    [
+        ("username", "data['username']"),
+        ("player_id", "data['player_id']"),
+        ("title", "_intern_opt(data.get('title'))"),
+        ("status", "sys.intern(data['status'])"),
+        ("name", "data.get('name')"),
+        ("avatar", "data.get('avatar')"),
+        ("location", "data.get('location')"),
+        ("country_url", "data['country']"),
+        ("joined_ts", "data['joined']"),
+        ("last_online_ts", "data['last_online']"),
+        ("followers", "data['followers']"),
+        ("is_streamer", "data.get('is_streamer', False)"),
+        ("twitch_url", "data.get('twitch_url')"),
+        ("fide", "data.get('fide')"),
+    ],
+    error_message="Invalid input. Expected a dictionary.",
+)
+_compile_from_dict(
+    DailyGame,
+    [
+        ("url", "data['url']"),
+        ("move_by_ts", "data['move_by']"),
+        ("last_activity_ts", "data['last_activity']"),
+        ("draw_offer", "False"),
+    ],
+)
+_compile_from_dict(
+    GamePlayer,
+    [
+        ("rating", "data['rating']"),
+        ("result", "data['result']"),
+        ("user_url", "data['@id']"),
+        ("username", "data['username']"),
+        ("uuid", "data['uuid']"),
+    ],
+)
+_compile_from_dict(
+    Game,
+    [
+        ("white_url", "data['white']"),
+        ("black_url", "data['black']"),
+        ("url", "data['url']"),
+        ("fen", "data['fen']"),
+        ("time_control", "sys.intern(data['time_control'])"),
+        ("time_class", "sys.intern(data['time_class'])"),
+        ("rules", "sys.intern(data['rules'])"),
+        ("rated", "data.get('rated', False)"),
+        ("accuracies", "data.get('accuracies')"),
+        ("tournament", "data.get('tournament')"),
+        ("match", "data.get('match')"),
+        ("eco", "data.get('eco')"),
+        ("start_time", "data.get('start_time')"),
+        ("end_time", "data.get('end_time')"),
+        ("id", "int(data['url'].split('/')[-1])"),
+        ("pgn", "data.get('pgn')"),
+        ("tcn", "data.get('tcn')"),
+        ("initial_setup", "data.get('initial_setup')"),
+        ("uuid", "data.get('uuid')"),
+    ],
+)
+_compile_from_dict(
+    UserClub,
+    [
+        ("club_id", "data.get('@id', '')"),
+        ("name", "data.get('name', '')"),
+        ("last_activity_ts", "data.get('last_activity', 0)"),
+        ("icon", "data.get('icon', '')"),
+        ("url", "data.get('url', '')"),
+        ("joined_ts", "data.get('joined', 0)"),
+    ],
+)
+_compile_from_dict(
+    Club,
+    [
+        ("id", "data.get('@id', '')"),
+        ("name", "data.get('name', '')"),
+        ("club_id", "data.get('club_id', 0)"),
+        ("country", "data.get('country', '')"),
+        ("average_daily_rating", "data.get('average_daily_rating', 0)"),
+        ("members_count", "data.get('members_count', 0)"),
+        ("created_ts", "data.get('created', 0)"),
+        ("last_activity_ts", "data.get('last_activity', 0)"),
+        ("admin", "data.get('admin', [])"),
+        ("visibility", "data.get('visibility', '')"),
+        ("join_request", "data.get('join_request', '')"),
+        ("icon", "data.get('icon', '')"),
+        ("description", "data.get('description', '')"),
+        ("url", "data.get('url', '')"),
+    ],
+)
+_compile_from_dict(
+    BoardGame,
+    [
+        ("white_url", "data['white']['@id']"),
+        ("black_url", "data['black']['@id']"),
+        ("url", "data['url']"),
+        ("fen", "data['fen']"),
+        ("time_control", "sys.intern(data['time_control'])"),
+        ("time_class", "sys.intern(data['time_class'])"),
+        ("rules", "sys.intern(data['rules'])"),
+        ("rated", "data.get('rated', False)"),
+        ("accuracies", "data.get('accuracies')"),
+        ("tournament", "data.get('tournament')"),
+        ("match", "data.get('match')"),
+        ("eco", "data.get('eco')"),
+        ("start_time", "data.get('start_time')"),
+        ("end_time", "data.get('end_time')"),
+        ("id", "int(data['url'].split('/')[-1])"),
+        ("pgn", "data.get('pgn')"),
+        ("tcn", "data.get('tcn')"),
+        ("initial_setup", "data.get('initial_setup')"),
+        ("uuid", "data.get('uuid')"),
+    ],
+    post=[
+        ("white", "GamePlayer.from_dict(data['white'])"),
+        ("black", "GamePlayer.from_dict(data['black'])"),
+    ],
+)
+for _match_cls in (FinishedPlayerMatch, InProgressPlayerMatch):
+    _compile_from_dict(
+        _match_cls,
+        [
+            ("name", "data['name']"),
+            ("url", "data['url']"),
+            ("id", "data['@id']"),
+            ("club_url", "data['club']"),
+            ("results", "MatchResult.from_dict(data['results'])"),
+            ("board_url", "data['board']"),
+        ],
+        pre=["_board_parts = data['board'].rsplit('/', 2)"],
+        post=[
+            ("_board_id", "(int(_board_parts[-2]), int(_board_parts[-1]))"),
+        ],
+    )
+_compile_from_dict(
+    RegisteredPlayerMatch,
+    [
+        ("name", "data['name']"),
+        ("url", "data['url']"),
+        ("club_url", "data['club']"),
+        ("match_url", "data['@id']"),
+    ],
+    post=[
+        ("_match_id", "int(data['@id'].rsplit('/', 1)[1])"),
+    ],
+)
+_compile_from_dict(
+    FinishedPlayerTournament,
+    [
+        ("url", "data['url']"),
+        ("tournament_url", "data['@id']"),
+        ("wins", "data['wins']"),
+        ("losses", "data['losses']"),
+        ("draws", "data['draws']"),
+        ("points_awarded", "data.get('points_awarded', 0)"),
+        ("placement", "data['placement']"),
+        ("status", "data['status']"),
+        ("total_players", "data['total_players']"),
+    ],
+)
+_compile_from_dict(
+    InProgressPlayerTournament,
+    [
+        ("url", "data['url']"),
+        ("tournament_url", "data['@id']"),
+        ("wins", "data['wins']"),
+        ("losses", "data['losses']"),
+        ("draws", "data['draws']"),
+        ("status", "data['status']"),
+        ("total_players", "data['total_players']"),
+    ],
+)
+_compile_from_dict(
+    RegisteredPlayerTournament,
+    [
+        ("url", "data['url']"),
+        ("tournament_url", "data['@id']"),
+        ("status", "data['status']"),
+    ],
+)
+_compile_from_dict(
+    FinishedClubMatch,
+    [
+        ("name", "data['name']"),
+        ("match_url", "data['@id']"),
+        ("opponent_url", "data['opponent']"),
+        ("start_time", "data['start_time']"),
+        ("time_class", "data['time_class']"),
+        ("result", "data['result']"),
+    ],
+    post=[
+        ("_match_id", "int(data['@id'].rsplit('/', 1)[1])"),
+        ("_opponent_id", "data['opponent'].rsplit('/', 1)[1]"),
+    ],
+)
+_compile_from_dict(
+    InProgressClubMatch,
+    [
+        ("name", "data['name']"),
+        ("match_url", "data['@id']"),
+        ("opponent_url", "data['opponent']"),
+        ("start_time", "data['start_time']"),
+        ("time_class", "data['time_class']"),
+    ],
+    post=[
+        ("_match_id", "int(data['@id'].rsplit('/', 1)[1])"),
+        ("_opponent_id", "data['opponent'].rsplit('/', 1)[1]"),
+    ],
+)
+_compile_from_dict(
+    RegisteredClubMatch,
+    [
+        ("name", "data['name']"),
+        ("match_url", "data['@id']"),
+        ("opponent_url", "data['opponent']"),
+        ("time_class", "data['time_class']"),
+    ],
+    post=[
+        ("_match_id", "int(data['@id'].rsplit('/', 1)[1])"),
+        ("_opponent_id", "data['opponent'].rsplit('/', 1)[1]"),
+    ],
+)
+_compile_from_dict(
+    Match,
+    [
+        ("match_url", "data['@id']"),
+        ("name", "data['name']"),
+        ("url", "data['url']"),
+        ("description", "data.get('description')"),
+        ("start_time", "data.get('start_time')"),
+        ("end_time", "data.get('end_time')"),
+        ("status", "data['status']"),
+        ("board_count", "data['boards']"),
+        ("settings", "data['settings']"),
+        ("teams", "data['teams']"),
+    ],
+    post=[
+        ("_match_id", "int(data['@id'].rsplit('/', 1)[1])"),
+    ],
+)
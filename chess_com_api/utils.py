@@ -1,11 +1,37 @@
 """Utility functions."""
 
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
+_UTC = timezone.utc
+# Bound once so cache misses skip the datetime -> fromtimestamp attribute walk.
+_FROM_TS = datetime.fromtimestamp
+
+
+@lru_cache(maxsize=4096)
+def _from_ts(timestamp: int) -> datetime:
+    """Build a UTC datetime for an epoch timestamp, memoized.
+
+    Timestamps repeat heavily across a player's games (the same ``joined``,
+    ``last_online``, and archive dates appear on row after row), so repeated
+    conversions become a cache hit instead of a fresh ``fromtimestamp`` call.
+    """
+    return _FROM_TS(timestamp, _UTC)
+
+
+if os.environ.get("CHESS_COM_TS_CACHE") == "0":
+    # Escape hatch for callers that feed unbounded unique timestamps and
+    # would rather skip the cache bookkeeping entirely.
+    _from_ts = _from_ts.__wrapped__  # type: ignore[assignment]
+
 
 def format_timestamp(timestamp: Optional[int]) -> Optional[datetime]:
-    """Convert Unix timestamp to datetime object."""
-    if timestamp is None:
-        return None
-    return datetime.fromtimestamp(timestamp)
+    """Convert Unix timestamp to a UTC-aware datetime object.
+
+    Binding the timezone avoids the local-tzdb lookup that naive
+    ``datetime.fromtimestamp`` performs on every call, and repeated
+    timestamps are served from a bounded memo.
+    """
+    return None if timestamp is None else _from_ts(timestamp)
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 
 from chess_com_api.client import ChessComClient
 from chess_com_api.exceptions import NotFoundError
@@ -27,22 +28,21 @@ from chess_com_api.models import (
 
 def get_file_hash(file_path: str, hash_algorithm: str = "sha256") -> str:
     """Compute the hash of a file with normalized line endings."""
-    # Create a hash object
-    hash_func = getattr(hashlib, hash_algorithm)()
-
-    # Read the file in binary mode
+    # Normalizing the whole file at once cannot split a CRLF pair across
+    # chunk boundaries, and a single update uses OpenSSL's one-shot digest.
     with open(file_path, "rb") as f:
-        while chunk := f.read(8192):  # Read in 8KB chunks
-            # Normalize line endings
-            chunk = chunk.replace(b"\r\n", b"\n")  # Convert CRLF to LF
-            hash_func.update(chunk)
+        data = f.read().replace(b"\r\n", b"\n")  # Convert CRLF to LF
 
-    return hash_func.hexdigest()  # type: ignore
+    return hashlib.new(hash_algorithm, data).hexdigest()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client() -> AsyncGenerator[ChessComClient, None]:
-    """Create test client instance."""
+    """Create test client instance.
+
+    Session scope shares one client — and its keep-alive connection pool and
+    TLS session — across the whole suite instead of reconnecting per test.
+    """
     async with ChessComClient(max_retries=50) as client:
         yield client
 
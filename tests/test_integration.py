@@ -1,23 +1,41 @@
 """Integration tests for the Chess.com API client."""
 
 import asyncio
+import json
 from typing import Any, AsyncGenerator
 from unittest.mock import AsyncMock
 
 import aiohttp
 import pytest
+import pytest_asyncio
 
 from chess_com_api.client import ChessComClient
 from chess_com_api.exceptions import ChessComAPIError, NotFoundError, RateLimitError
 from chess_com_api.models import ClubMatches, Country
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client() -> AsyncGenerator[ChessComClient, None]:
     """Create and yield an asynchronous ChessComClient fixture.
 
     This fixture is used to manage the lifecycle of a ChessComClient instance,
     ensuring it is properly initialized and closed when tests are executed.
+    Session scope reuses one connection pool across the suite.
+
+    :return: An instance of ChessComClient.
+    :rtype: ChessComClient
+    """
+    async with ChessComClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def mock_client() -> AsyncGenerator[ChessComClient, None]:
+    """Create a fresh client for tests that patch the transport.
+
+    Function scope keeps the entity cache empty, so patched
+    ``_make_request``/``session.get`` calls are actually exercised instead
+    of being served from the session-wide client's cache.
 
     :return: An instance of ChessComClient.
     :rtype: ChessComClient
@@ -66,7 +84,7 @@ class TestPlayerEndpoints:
         """Test getting player statistics."""
         stats = await client.get_player_stats("hikaru")
         assert stats.chess_blitz is not None
-        assert "rating" in stats.chess_blitz["last"]
+        assert stats.chess_blitz.last_rating is not None
 
     async def test_player_games(self, client: ChessComClient) -> None:
         """Test getting player games."""
@@ -226,12 +244,14 @@ class TestErrorHandling:
         with pytest.raises(NotFoundError):
             await client.get_player("thisisnotarealuser12345")
 
-    async def test_rate_limit(self, client: ChessComClient, monkeypatch: Any) -> None:
+    async def test_rate_limit(
+        self, mock_client: ChessComClient, monkeypatch: Any
+    ) -> None:
         """Test rate limit handling."""
         mock_request = AsyncMock(side_effect=RateLimitError("Rate limit exceeded"))
-        monkeypatch.setattr(client, "_make_request", mock_request)
+        monkeypatch.setattr(mock_client, "_make_request", mock_request)
 
-        tasks = [client.get_player("hikaru") for _ in range(10)]
+        tasks = [mock_client.get_player("hikaru") for _ in range(10)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         assert any(isinstance(r, RateLimitError) for r in results)
@@ -251,51 +271,64 @@ class TestRetryMechanism:
     number of retries is exceeded.
     """
 
-    async def test_retry_success(self, client: ChessComClient, mocker: Any) -> None:
+    async def test_retry_success(
+        self, mock_client: ChessComClient, mocker: Any
+    ) -> None:
         """Test successful retry after failure."""
-        # Mock the `get` method to fail once and succeed on the second attempt
+        # Mock the `get` method to fail once and succeed on the second attempt.
+        # The client decodes raw bytes from `read()`, so that is what we stub.
         mock_response = AsyncMock()
         mock_response.__aenter__.return_value.status = 200
-        mock_response.__aenter__.return_value.json = AsyncMock(
-            return_value={
-                "avatar": "https://images.chesscomfiles.com/uploads/v1/user/15448422.88c010c1.200x200o.3c5619f5441e.png",
-                "player_id": 15448422,
-                "@id": "https://api.chess.com/pub/player/hikaru",
-                "url": "https://www.chess.com/member/Hikaru",
-                "name": "Hikaru Nakamura",
-                "username": "hikaru",
-                "title": "GM",
-                "followers": 1225729,
-                "country": "https://api.chess.com/pub/country/US",
-                "location": "Florida",
-                "last_online": 1732135306,
-                "joined": 1389043258,
-                "status": "premium",
-                "is_streamer": True,
-                "twitch_url": "https://twitch.tv/gmhikaru",
-                "verified": False,
-                "league": "Legend",
-                "streaming_platforms": [
-                    {"type": "twitch", "channel_url": "https://twitch.tv/gmhikaru"}
-                ],
-            }
+        mock_response.__aenter__.return_value.headers = {}
+        mock_response.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "avatar": "https://images.chesscomfiles.com/uploads/v1/user/15448422.88c010c1.200x200o.3c5619f5441e.png",
+                    "player_id": 15448422,
+                    "@id": "https://api.chess.com/pub/player/hikaru",
+                    "url": "https://www.chess.com/member/Hikaru",
+                    "name": "Hikaru Nakamura",
+                    "username": "hikaru",
+                    "title": "GM",
+                    "followers": 1225729,
+                    "country": "https://api.chess.com/pub/country/US",
+                    "location": "Florida",
+                    "last_online": 1732135306,
+                    "joined": 1389043258,
+                    "status": "premium",
+                    "is_streamer": True,
+                    "twitch_url": "https://twitch.tv/gmhikaru",
+                    "verified": False,
+                    "league": "Legend",
+                    "streaming_platforms": [
+                        {
+                            "type": "twitch",
+                            "channel_url": "https://twitch.tv/gmhikaru",
+                        }
+                    ],
+                }
+            ).encode()
         )
 
         mocker.patch.object(
-            client.session, "get", side_effect=[aiohttp.ClientError(), mock_response]
+            mock_client.session,
+            "get",
+            side_effect=[aiohttp.ClientError(), mock_response],
         )
 
-        result = await client.get_player("hikaru")
+        result = await mock_client.get_player("hikaru")
         assert result.username == "hikaru"
 
     async def test_max_retries_exceeded(
-        self, client: ChessComClient, mocker: Any
+        self, mock_client: ChessComClient, mocker: Any
     ) -> None:
         """Test max retries exceeded."""
-        mocker.patch.object(client.session, "get", side_effect=aiohttp.ClientError())
+        mocker.patch.object(
+            mock_client.session, "get", side_effect=aiohttp.ClientError()
+        )
 
         with pytest.raises(ChessComAPIError):
-            await client.get_player("hikaru")
+            await mock_client.get_player("hikaru")
 
 
 @pytest.mark.asyncio
@@ -1,5 +1,6 @@
 """Tests for the models module."""
 
+import sys
 from datetime import datetime
 
 from chess_com_api.models import Game, Player, PlayerStats
@@ -25,6 +26,9 @@ def test_player_model() -> None:
     assert player.username == "hikaru"
     assert player.title == "GM"
     assert isinstance(player.joined, datetime)
+    if sys.version_info >= (3, 10):
+        # Models are slotted on 3.10+, so instances carry no __dict__.
+        assert not hasattr(player, "__dict__")
 
 
 def test_player_stats_model() -> None:
@@ -67,7 +71,12 @@ def test_game_model() -> None:
     game = Game.from_dict(data)
     assert game.url == "https://example.com/game/18023"
     assert game.time_class == "blitz"
+    # Low-cardinality fields are interned so repeated rows share one string.
+    assert game.time_class is sys.intern("blitz")
     assert game.id == 18023
+    # Moves are parsed from the PGN lazily and memoized per instance.
+    assert game.moves == ["e4", "e5"]
+    assert game.moves is game.moves
 
 
 # Add more model tests...
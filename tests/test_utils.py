@@ -19,3 +19,8 @@ def test_format_timestamp() -> None:
 
     assert isinstance(formatted, datetime)
     assert format_timestamp(None) is None
+    # Repeated timestamps are memoized, so equal inputs share one object.
+    assert format_timestamp(now) is formatted
+    # Every conversion reuses the module-level UTC singleton.
+    later = format_timestamp(now + 1)
+    assert later is not None and later.tzinfo is formatted.tzinfo